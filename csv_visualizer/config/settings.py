@@ -5,8 +5,13 @@ from pathlib import Path
 import json
 from typing import ClassVar
 
+try:
+    import orjson
+except ImportError:  # orjson je opcionalan, koristi se stdlib json
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Settings:
     """Glavne postavke aplikacije."""
 
@@ -73,13 +78,36 @@ class Settings:
         (1.00, 93, 4, 90, 100),
     ])
 
-    _config_path: ClassVar[Path] = Path.home() / ".csv_visualizer" / "settings.json"
+    # Parovi (ocjena, prag) sortirani silazno po pragu, računa se jednom
+    _sorted_grade_thresholds: tuple[tuple[int, int], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
 
-    def save(self) -> None:
-        """Sprema postavke u JSON datoteku."""
-        self._config_path.parent.mkdir(parents=True, exist_ok=True)
+    _config_path: ClassVar[Path] = Path.home() / ".csv_visualizer" / "settings.json"
 
-        data = {
+    def __post_init__(self) -> None:
+        """Priprema izvedene vrijednosti postavki."""
+        self._update_derived()
+
+    def _update_derived(self) -> None:
+        """Ponovno računa izvedene vrijednosti iz trenutnih postavki."""
+        # Ključevi iz JSON-a su stringovi ("5"), ocjene moraju biti cijeli brojevi
+        self._sorted_grade_thresholds = tuple(
+            sorted(
+                ((int(grade), threshold) for grade, threshold in self.grade_thresholds.items()),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        )
+
+    @property
+    def sorted_grade_thresholds(self) -> tuple[tuple[int, int], ...]:
+        """Parovi (ocjena, prag) od najvišeg praga prema najnižem."""
+        return self._sorted_grade_thresholds
+
+    def to_dict(self) -> dict:
+        """Vraća postavke koje se spremaju u JSON."""
+        return {
             "default_csv_path": self.default_csv_path,
             "last_opened_path": self.last_opened_path,
             "last_save_path": self.last_save_path,
@@ -91,8 +119,24 @@ class Settings:
             "default_format": self.default_format,
         }
 
-        with open(self._config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def save(self, data: dict | None = None) -> None:
+        """
+        Sprema postavke u JSON datoteku.
+
+        Args:
+            data: Snimka iz to_dict() - omogućuje spremanje iz druge dretve
+                  (default: trenutne postavke)
+        """
+        if data is None:
+            data = self.to_dict()
+
+        self._config_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if orjson is not None:
+            self._config_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self._config_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
     @classmethod
     def load(cls) -> "Settings":
@@ -101,14 +145,21 @@ class Settings:
 
         if cls._config_path.exists():
             try:
-                with open(cls._config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                if orjson is not None:
+                    # orjson.JSONDecodeError nasljeđuje json.JSONDecodeError
+                    data = orjson.loads(cls._config_path.read_bytes())
+                else:
+                    with open(cls._config_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
 
                 for key, value in data.items():
-                    if hasattr(settings, key):
+                    # Privatni atributi (npr. izvedene vrijednosti) ne učitavaju se
+                    if not key.startswith("_") and hasattr(settings, key):
                         setattr(settings, key, value)
             except (json.JSONDecodeError, IOError):
                 pass
+            # Učitane vrijednosti (npr. grade_thresholds) mijenjaju izvedene
+            settings._update_derived()
 
         return settings
 
@@ -1,10 +1,12 @@
 """Definicije tema za aplikaciju (light/dark mode)."""
 
+import inspect
+import weakref
 from dataclasses import dataclass, field
-from typing import ClassVar
+from typing import Callable, ClassVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Theme:
     """Definicija teme za GUI i grafove."""
 
@@ -136,14 +138,16 @@ class ThemeManager:
         "dark": DARK_THEME,
     }
     _current: ClassVar[Theme] = LIGHT_THEME
-    _listeners: ClassVar[list["Callable[[Theme], None]"]] = []
+    # Ključ -> slaba referenca na listener; metode uništenih widgeta ne drže se
+    # živima, a ključ omogućuje uklanjanje bez linearnog traženja
+    _listeners: ClassVar[dict[object, Callable[[], Callable[[Theme], None] | None]]] = {}
     _initialized: ClassVar[bool] = False
 
     @classmethod
     def _ensure_initialized(cls) -> None:
-        """Osigurava da su listeneri inicijalizirani kao nova lista."""
+        """Osigurava da su listeneri inicijalizirani kao novi rječnik."""
         if not cls._initialized:
-            cls._listeners = []
+            cls._listeners = {}
             cls._initialized = True
 
     @classmethod
@@ -166,28 +170,58 @@ class ThemeManager:
         cls.set_theme(new_name)
         return cls._current
 
+    @staticmethod
+    def _listener_key(callback) -> object:
+        """
+        Vraća ključ listenera.
+
+        Vezane metode nastaju pri svakom pristupu, pa je ključ WeakMethod -
+        jednak za istu metodu istog objekta dok je objekt živ.
+        """
+        if inspect.ismethod(callback):
+            return weakref.WeakMethod(callback)
+        return callback
+
     @classmethod
     def add_listener(cls, callback) -> None:
         """Dodaje listener za promjene teme."""
         cls._ensure_initialized()
-        if callback not in cls._listeners:
-            cls._listeners.append(callback)
+        key = cls._listener_key(callback)
+        if key in cls._listeners:
+            return
+
+        if isinstance(key, weakref.WeakMethod):
+            # Referenca sama uklanja listener kad vlasnik metode nestane
+            ref = weakref.WeakMethod(
+                callback, lambda _, key=key: cls._discard_listener(key)
+            )
+        else:
+            # Obične funkcije i lambde nemaju vlasnika, čuvaju se izravno
+            ref = lambda: callback
+        # Copy-on-write: novi rječnik, pa iteracija u _notify_listeners ne treba kopiju
+        cls._listeners = {**cls._listeners, key: ref}
+
+    @classmethod
+    def _discard_listener(cls, key: object) -> None:
+        """Uklanja listener po ključu (copy-on-write, kao add_listener)."""
+        if key in cls._listeners:
+            cls._listeners = {k: ref for k, ref in cls._listeners.items() if k != key}
 
     @classmethod
     def remove_listener(cls, callback) -> None:
         """Uklanja listener."""
         cls._ensure_initialized()
-        try:
-            cls._listeners.remove(callback)
-        except ValueError:
-            pass  # Listener već uklonjen
+        cls._discard_listener(cls._listener_key(callback))
 
     @classmethod
     def _notify_listeners(cls) -> None:
         """Obavještava sve listenere o promjeni teme."""
         cls._ensure_initialized()
-        # Kopiraj listu da izbjegnemo probleme s modifikacijom tijekom iteracije
-        for callback in cls._listeners[:]:
+        # add/remove zamjenjuju rječnik umjesto da ga mijenjaju, pa kopija nije potrebna
+        for ref in cls._listeners.values():
+            callback = ref()
+            if callback is None:
+                continue
             try:
                 callback(cls._current)
             except Exception:
@@ -1,28 +1,82 @@
 """Generator sintetičkih podataka studenata."""
 
-import random
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from ..config import get_settings
+from .loader import DataLoader
 from .models import ExamData
 
 
 class DataGenerator:
     """Generira sintetičke podatke o studentima."""
 
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
+        """
+        Args:
+            seed: Sjeme generatora slučajnih brojeva (za ponovljive podatke)
+        """
         self.settings = get_settings()
+        self._rng = np.random.default_rng(seed)
+
+        # Pragovi ocjena sortirani uzlazno za np.searchsorted
+        ordered = self.settings.sorted_grade_thresholds[::-1]
+        self._grade_bins = np.array([threshold for _, threshold in ordered])
+        # Ocjena po broju prijeđenih pragova; ispod najnižeg praga je ocjena 1,
+        # kao u _score_to_grade
+        self._grade_lookup = np.array(
+            [1, *(grade for grade, _ in ordered)],
+            dtype=DataLoader.COLUMN_DTYPES["ocjena"],
+        )
+
+        # Stupci distribucije bodova: granica, prosjek, devijacija, minimum, maksimum
+        self._score_distribution = np.array(
+            self.settings.score_distribution, dtype=float
+        ).T
 
     def _score_to_grade(self, score: int) -> int:
         """Pretvara bodove u ocjenu."""
-        thresholds = self.settings.grade_thresholds
-        for grade in sorted(thresholds.keys(), reverse=True):
-            if score >= thresholds[grade]:
+        for grade, threshold in self.settings.sorted_grade_thresholds:
+            if score >= threshold:
                 return grade
         return 1
 
+    def _generate_scores(self, count: int) -> np.ndarray:
+        """Generira bodove za sve studente prema distribuciji."""
+        thresholds, means, stds, min_scores, max_scores = self._score_distribution
+
+        # Svaki student upada u prvi razred čija je granica veća od bacanja
+        rolls = self._rng.random(count)
+        buckets = np.searchsorted(thresholds, rolls, side="right")
+
+        # Jedan niz standardne normalne razdiobe pa afina transformacija
+        # parametrima razreda pojedinog studenta (na mjestu, bez novih nizova)
+        samples = self._rng.standard_normal(count)
+        samples *= stds[buckets]
+        samples += means[buckets]
+        np.clip(samples, min_scores[buckets], max_scores[buckets], out=samples)
+
+        # Bodovi se pohranjuju u uskom tipu (raspon je ograničen clipom)
+        return samples.astype(DataLoader.COLUMN_DTYPES["bodovi"])
+
+    def _scores_to_grades(self, scores: np.ndarray) -> np.ndarray:
+        """Pretvara niz bodova u niz ocjena."""
+        # Jedno binarno pretraživanje po svim bodovima, bez grananja po studentu
+        passed_thresholds = np.searchsorted(self._grade_bins, scores, side="right")
+        return self._grade_lookup[passed_thresholds]
+
+    @staticmethod
+    def _categorical(values: list[str], indices: np.ndarray) -> pd.Categorical:
+        """
+        Gradi kategorijski stupac izravno iz indeksa u popis vrijednosti.
+
+        Kategorije su cijeli (sortirani) popis iz postavki, pa se stringovi
+        pojedinih redova nikad ne materijaliziraju ni ne hashiraju.
+        """
+        categories, codes = np.unique(values, return_inverse=True)
+        return pd.Categorical.from_codes(codes[indices], categories=categories)
+
     def generate(
         self,
         count: int | None = None,
@@ -41,11 +95,15 @@ class DataGenerator:
         Raises:
             ValueError: Ako je broj studenata prevelik za jedinstvena imena
         """
+        settings = self.settings
+        surnames = settings.surnames
+        exam_terms = settings.exam_terms
+
         if count is None:
-            count = self.settings.default_student_count
+            count = settings.default_student_count
 
-        all_names = self.settings.male_names + self.settings.female_names
-        max_combinations = len(all_names) * len(self.settings.surnames)
+        all_names = settings.male_names + settings.female_names
+        max_combinations = len(all_names) * len(surnames)
 
         if count > max_combinations:
             raise ValueError(
@@ -53,55 +111,29 @@ class DataGenerator:
                 f"jedinstvenih kombinacija imena ({max_combinations})."
             )
 
-        records = []
-        used_names: set[str] = set()
-
-        for i in range(1, count + 1):
-            # Generiraj jedinstveno ime
-            for _ in range(1000):
-                if random.random() < 0.5:
-                    first_name = random.choice(self.settings.male_names)
-                else:
-                    first_name = random.choice(self.settings.female_names)
-                last_name = random.choice(self.settings.surnames)
-                full_name = f"{first_name} {last_name}"
-
-                if full_name not in used_names:
-                    used_names.add(full_name)
-                    break
-            else:
-                raise RuntimeError(
-                    f"Nije moguće generirati jedinstveno ime nakon 1000 pokušaja."
-                )
-
-            # Odaberi termin
-            term = random.choice(self.settings.exam_terms)
-
-            # Generiraj bodove prema distribuciji
-            roll = random.random()
-            for threshold, mean, std, min_score, max_score in self.settings.score_distribution:
-                if roll < threshold:
-                    score = int(np.clip(np.random.normal(mean, std), min_score, max_score))
-                    break
-
-            grade = self._score_to_grade(score)
-
-            records.append({
-                "student_id": i,
-                "ime": first_name,
-                "prezime": last_name,
-                "termin": term,
-                "bodovi": score,
-                "ocjena": grade,
-            })
-
-        df = pd.DataFrame(records)
+        scores = self._generate_scores(count)
+        grades = self._scores_to_grades(scores)
+
+        # Jedinstvene kombinacije ime-prezime: uzorak indeksa kartezijevog produkta
+        # bez ponavljanja (ne permutira se cijeli produkt kad je count mnogo manji)
+        pair_indices = self._rng.choice(max_combinations, size=count, replace=False)
+        first_indices, last_indices = np.divmod(pair_indices, len(surnames))
+        term_indices = self._rng.integers(0, len(exam_terms), size=count)
+
+        df = pd.DataFrame({
+            "student_id": np.arange(1, count + 1),
+            "ime": self._categorical(all_names, first_indices),
+            "prezime": self._categorical(surnames, last_indices),
+            "termin": self._categorical(exam_terms, term_indices),
+            "bodovi": scores,
+            "ocjena": grades,
+        }).astype(DataLoader.COLUMN_DTYPES)
 
         # Spremi ako je navedena putanja
         actual_path = save_path
         if save_path:
             try:
-                df.to_csv(save_path, index=False)
+                DataLoader.save_csv(df, save_path)
             except (IOError, OSError) as e:
                 raise IOError(f"Nije moguće spremiti CSV na '{save_path}': {e}") from e
 
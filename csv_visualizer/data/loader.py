@@ -1,9 +1,18 @@
 """Učitavanje i validacija CSV podataka."""
 
+import numpy as np
 import pandas as pd
+from functools import cache
 from pathlib import Path
 from typing import ClassVar
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow je opcionalan, koristi se pandas C parser
+    pa = None
+    pacsv = None
+
 from .models import ExamData
 
 
@@ -28,20 +37,108 @@ class DataLoader:
         "ocjena": ["ocjena", "grade", "ocj"],
     }
 
+    # Obrnuto mapiranje alias -> (standardni naziv, prioritet), računa se jednom
+    _ALIAS_TO_STANDARD: ClassVar[dict[str, tuple[str, int]]] = {
+        alias.lower(): (standard_name, rank)
+        for standard_name, aliases in COLUMN_ALIASES.items()
+        for rank, alias in enumerate(aliases)
+    }
+
+    # Tipovi pri čitanju - uži cjelobrojni tipovi bi se tiho prelili (300 -> 44)
+    READ_DTYPES: ClassVar[dict[str, str]] = {
+        "student_id": "int64",
+        "ime": "category",
+        "prezime": "category",
+        "termin": "category",
+        "bodovi": "int64",
+        "ocjena": "int64",
+    }
+
+    # Tipovi pohrane, primjenjuju se tek nakon validacije raspona
+    COLUMN_DTYPES: ClassVar[dict[str, str]] = {
+        "student_id": "int32",
+        "ime": "category",
+        "prezime": "category",
+        "termin": "category",
+        "bodovi": "int8",
+        "ocjena": "int8",
+    }
+
+    @classmethod
+    def _column_mapping(cls, columns) -> dict[str, str]:
+        """Vraća mapiranje originalnih naziva stupaca na standardne."""
+        # Za svaki standardni naziv pobjeđuje alias koji je ranije u COLUMN_ALIASES
+        best: dict[str, tuple[int, str]] = {}
+        for col in columns:
+            match = cls._ALIAS_TO_STANDARD.get(col.lower())
+            if match is None:
+                continue
+            standard_name, rank = match
+            if standard_name not in best or rank < best[standard_name][0]:
+                best[standard_name] = (rank, col)
+
+        return {col: standard_name for standard_name, (_, col) in best.items()}
+
     @classmethod
     def _normalize_columns(cls, df: pd.DataFrame) -> pd.DataFrame:
         """Normalizira nazive stupaca."""
-        column_mapping = {}
-        df_columns_lower = {col.lower(): col for col in df.columns}
+        return df.rename(columns=cls._column_mapping(df.columns))
+
+    @classmethod
+    def _read_csv(cls, path: str, encoding: str) -> pd.DataFrame:
+        """Čita CSV sa zadanim tipovima stupaca kako bi se preskočilo zaključivanje."""
+        header = pd.read_csv(path, encoding=encoding, nrows=0)
+        column_mapping = cls._column_mapping(header.columns)
+
+        # Bez svih potrebnih stupaca čitaj sve, validacija će prijaviti grešku
+        if set(column_mapping.values()) != cls.REQUIRED_COLUMNS:
+            return pd.read_csv(path, encoding=encoding)
+
+        usecols = [col for col in header.columns if col in column_mapping]
+        dtypes = {
+            original: cls.READ_DTYPES[standard]
+            for original, standard in column_mapping.items()
+        }
+        try:
+            if pacsv is not None:
+                return cls._read_csv_arrow(path, encoding, usecols, dtypes)
+            return pd.read_csv(path, encoding=encoding, usecols=usecols, dtype=dtypes)
+        except (ValueError, OverflowError):
+            # Neispravne numeričke vrijednosti - čitaj tekst, validacija javlja grešku
+            # (pyarrow.ArrowInvalid nasljeđuje ValueError)
+            text_dtypes = {
+                original: dtype for original, dtype in dtypes.items() if dtype == "category"
+            }
+            return pd.read_csv(path, encoding=encoding, usecols=usecols, dtype=text_dtypes)
+
+    @classmethod
+    def _read_csv_arrow(
+        cls,
+        path: str,
+        encoding: str,
+        usecols: list[str],
+        dtypes: dict[str, str]
+    ) -> pd.DataFrame:
+        """Čita CSV višedretvenim pyarrow parserom."""
+        column_types = {
+            col: pa.dictionary(pa.int32(), pa.string()) if dtype == "category" else pa.int64()
+            for col, dtype in dtypes.items()
+        }
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(encoding=encoding),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                include_columns=usecols,
+            ),
+        )
+        df = table.to_pandas()
 
-        for standard_name, aliases in cls.COLUMN_ALIASES.items():
-            for alias in aliases:
-                if alias.lower() in df_columns_lower:
-                    original_col = df_columns_lower[alias.lower()]
-                    column_mapping[original_col] = standard_name
-                    break
+        # pyarrow slaže kategorije redom pojavljivanja, pandas ih sortira
+        for col in df.select_dtypes("category"):
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
 
-        return df.rename(columns=column_mapping)
+        return df
 
     @classmethod
     def _validate(cls, df: pd.DataFrame, path: str) -> None:
@@ -56,7 +153,7 @@ class DataLoader:
             )
 
         # Provjeri tipove podataka
-        if df["bodovi"].dtype not in ["int64", "float64", "int32", "float32"]:
+        if not pd.api.types.is_numeric_dtype(df["bodovi"]):
             try:
                 df["bodovi"] = pd.to_numeric(df["bodovi"], errors="coerce")
                 if df["bodovi"].isna().any():
@@ -66,7 +163,7 @@ class DataLoader:
             except Exception as e:
                 raise DataValidationError(f"Stupac 'bodovi' mora biti numerički: {e}")
 
-        if df["ocjena"].dtype not in ["int64", "int32"]:
+        if not pd.api.types.is_integer_dtype(df["ocjena"]):
             try:
                 df["ocjena"] = df["ocjena"].astype(int)
             except Exception as e:
@@ -108,10 +205,10 @@ class DataLoader:
             raise DataValidationError(f"Datoteka mora biti CSV format, ne '{path_obj.suffix}'.")
 
         try:
-            df = pd.read_csv(path, encoding="utf-8")
+            df = cls._read_csv(path, encoding="utf-8")
         except UnicodeDecodeError:
             # Pokušaj s drugim encodingom
-            df = pd.read_csv(path, encoding="latin-1")
+            df = cls._read_csv(path, encoding="latin-1")
         except Exception as e:
             raise DataValidationError(f"Greška pri čitanju CSV datoteke: {e}")
 
@@ -124,12 +221,85 @@ class DataLoader:
         # Validiraj
         cls._validate(df, path)
 
-        # Osiguraj tipove
-        df["bodovi"] = df["bodovi"].astype(int)
-        df["ocjena"] = df["ocjena"].astype(int)
+        # Osiguraj i suzi tipove - raspon bodova i ocjena je validiran
+        df = df.astype(
+            {col: cls.COLUMN_DTYPES[col] for col in ("bodovi", "ocjena")},
+            copy=False,
+        )
+
+        # ID se ne validira, pa se sužava samo ako stane u ciljni tip
+        student_ids = df["student_id"]
+        id_limits = np.iinfo(cls.COLUMN_DTYPES["student_id"])
+        if (
+            pd.api.types.is_integer_dtype(student_ids)
+            and student_ids.between(id_limits.min, id_limits.max).all()
+        ):
+            df["student_id"] = student_ids.astype(cls.COLUMN_DTYPES["student_id"])
 
         return ExamData(df, path)
 
+    @staticmethod
+    @cache
+    def _arrow_write_options() -> "pacsv.WriteOptions | None":
+        """
+        Opcije pyarrow writera bez navodnika (ni u zaglavlju) - isti zapis
+        kao pandas to_csv.
+
+        Gradi se tek pri prvom spremanju: quoting_header postoji samo u
+        novijim verzijama pyarrowa, u starijima se vraća None (piše pandas).
+        """
+        try:
+            return pacsv.WriteOptions(quoting_style="none", quoting_header="none")
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _arrow_writes_like_pandas(dtype: "pa.DataType") -> bool:
+        """Zapisuje li pyarrow stupac ovog tipa jednako kao pandas."""
+        if pa.types.is_dictionary(dtype):
+            dtype = dtype.value_type
+        return (
+            pa.types.is_integer(dtype)
+            or pa.types.is_string(dtype)
+            or pa.types.is_large_string(dtype)
+        )
+
+    @classmethod
+    def save_csv(cls, df: pd.DataFrame, path: str) -> None:
+        """
+        Sprema DataFrame u CSV (UTF-8, bez indeksa).
+
+        Koristi pyarrow CSV writer ako je instaliran i ako daje isti
+        zapis kao DataFrame.to_csv(index=False), inače pandas.
+
+        Args:
+            df: Podaci za spremanje
+            path: Putanja CSV datoteke
+        """
+        write_options = cls._arrow_write_options() if pacsv is not None else None
+        if write_options is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Stupci mješovitih tipova - pandas ih zapisuje kao tekst
+                table = None
+
+            # Decimalne i logičke vrijednosti pyarrow formatira drukčije
+            # od pandasa (1 umjesto 1.0, true umjesto True)
+            if table is not None and all(
+                map(cls._arrow_writes_like_pandas, table.schema.types)
+            ):
+                try:
+                    pacsv.write_csv(table, path, write_options=write_options)
+                except pa.ArrowInvalid:
+                    # Vrijednost traži navodnike (zarez, navodnik, novi red) -
+                    # bez navodnika pyarrow je odbija, pandas je citira po potrebi
+                    pass
+                else:
+                    return
+
+        df.to_csv(path, index=False, encoding="utf-8")
+
     @classmethod
     def can_load(cls, path: str) -> tuple[bool, str]:
         """
@@ -1,11 +1,12 @@
 """Podatkovni modeli."""
 
 from dataclasses import dataclass, field
-from typing import Iterator
+from typing import Any, Callable, Iterator
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentRecord:
     """Predstavlja jedan zapis studenta."""
 
@@ -38,12 +39,38 @@ class StudentRecord:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExamData:
     """Wrapper za podatke ispita s pomoćnim metodama."""
 
     _df: pd.DataFrame
     _source_path: str | None = None
+    # DataFrame se nakon kreiranja ne mijenja (filteri vraćaju novi objekt),
+    # pa se izvedene vrijednosti mogu računati samo jednom
+    _cache: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # NumPy pogledi na stupce, postavljaju se u __post_init__
+    _scores: np.ndarray = field(init=False, repr=False, compare=False)
+    _grades: np.ndarray = field(init=False, repr=False, compare=False)
+    _passed: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Priprema NumPy poglede na numeričke stupce."""
+        grades = self._df["ocjena"].to_numpy()
+        # Klasa je frozen, pa se izvedena polja postavljaju zaobilazno
+        object.__setattr__(self, "_scores", self._df["bodovi"].to_numpy())
+        object.__setattr__(self, "_grades", grades)
+        object.__setattr__(self, "_passed", grades >= 2)
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Vraća memoiziranu vrijednost, računa je pri prvom pozivu."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
 
     @property
     def dataframe(self) -> pd.DataFrame:
@@ -63,48 +90,146 @@ class ExamData:
     @property
     def average_score(self) -> float:
         """Prosječni bodovi."""
-        return float(self._df["bodovi"].mean())
+        return self._cached("average_score", lambda: self._mean(self._scores))
 
     @property
     def average_grade(self) -> float:
         """Prosječna ocjena."""
-        return float(self._df["ocjena"].mean())
+        return self._cached("average_grade", lambda: self._mean(self._grades))
 
     @property
     def pass_rate(self) -> float:
         """Prolaznost u postocima."""
-        if len(self._df) == 0:
+        return self._cached("pass_rate", self._compute_pass_rate)
+
+    @staticmethod
+    def _mean(values: np.ndarray) -> float:
+        """Prosjek niza; NaN za prazan niz, kao pandas."""
+        return float(values.mean()) if len(values) else float("nan")
+
+    def _compute_pass_rate(self) -> float:
+        """Računa prolaznost."""
+        if len(self._passed) == 0:
             return 0.0
-        passed = (self._df["ocjena"] >= 2).sum()
-        return (passed / len(self._df)) * 100
+        return float(self._passed.mean()) * 100
 
     @property
     def terms(self) -> list[str]:
         """Lista svih termina."""
-        return sorted(self._df["termin"].unique().tolist())
+        # Indeks sažetka je već sortiran (kod kategorija preko kodova, bez
+        # usporedbe stringova) i sadrži samo prisutne termine
+        return self._cached(
+            "terms", lambda: self.get_term_summary().index.tolist()
+        )
 
     @property
     def grades(self) -> list[int]:
         """Lista svih ocjena."""
-        return sorted(self._df["ocjena"].unique().tolist())
+        return self._cached(
+            "grades", lambda: self.get_grade_counts().index.tolist()
+        )
+
+    def get_grade_counts(self) -> pd.Series:
+        """Broj studenata po prisutnoj ocjeni, sortirano po ocjeni."""
+        return self._cached("grade_counts", self._compute_grade_counts)
+
+    def _compute_grade_counts(self) -> pd.Series:
+        """Broji ocjene jednim prolazom (ocjene su validirani mali cijeli brojevi)."""
+        counts = np.bincount(self._grades)
+        present = np.flatnonzero(counts)
+        return pd.Series(counts[present], index=present)
 
     def get_grade_distribution(self) -> dict[int, int]:
         """Vraća distribuciju ocjena."""
-        counts = self._df["ocjena"].value_counts().to_dict()
+        return self._cached("grade_distribution", self._compute_grade_distribution)
+
+    def _compute_grade_distribution(self) -> dict[int, int]:
+        """Računa distribuciju ocjena."""
+        counts = self.get_grade_counts().to_dict()
         return {int(k): int(v) for k, v in counts.items()}
 
     def get_term_stats(self, term: str) -> dict:
         """Vraća statistiku za određeni termin."""
-        term_df = self._df[self._df["termin"] == term]
-        if len(term_df) == 0:
+        term_stats = self._get_all_term_stats()
+        if term not in term_stats:
             return {"count": 0, "avg_score": 0, "avg_grade": 0, "pass_rate": 0}
+        return term_stats[term]
+
+    def get_term_summary(self) -> pd.DataFrame:
+        """
+        Sažetak po terminima, sortiran po terminu.
+
+        Stupci: count, avg_score, avg_grade i pass_rate (u postocima). Isti
+        sažetak dijele statistika i grafovi po terminima.
+        """
+        return self._cached("term_summary", self._compute_term_summary)
+
+    def _term_codes(self) -> tuple[np.ndarray, pd.Index]:
+        """Kod termina po redu (-1 za nedostajući) i prisutni termini, sortirani."""
+        # Kod kategorija factorize radi nad postojećim kodovima, bez hashiranja stringova
+        return self._cached(
+            "term_codes", lambda: pd.factorize(self._df["termin"], sort=True)
+        )
+
+    def _compute_term_summary(self) -> pd.DataFrame:
+        """Računa sažetak po terminima zbrajanjem NumPy nizova po kodu termina."""
+        codes, terms = self._term_codes()
+        # Redovi bez termina se preskaču, kao u groupby
+        valid = codes >= 0
+        codes = codes[valid]
+        counts = np.bincount(codes, minlength=len(terms))
+
+        def means(values: np.ndarray) -> np.ndarray:
+            sums = np.bincount(codes, weights=values[valid], minlength=len(terms))
+            return sums / counts
+
+        return pd.DataFrame(
+            {
+                "count": counts,
+                "avg_score": means(self._scores),
+                "avg_grade": means(self._grades),
+                "pass_rate": means(self._passed) * 100,
+            },
+            index=terms.rename("termin"),
+        )
+
+    def get_scores_by_term(self) -> dict[str, np.ndarray]:
+        """Bodovi po terminu, sortirano po terminu."""
+        return self._cached("scores_by_term", self._compute_scores_by_term)
+
+    def _compute_scores_by_term(self) -> dict[str, np.ndarray]:
+        """Dijeli bodove po terminima jednim stabilnim sortiranjem po kodu termina."""
+        codes, terms = self._term_codes()
+        counts = self.get_term_summary()["count"].to_numpy()
+
+        # Stabilno sortiranje čuva redoslijed unutar termina; redovi bez
+        # termina (kod -1) su na početku i preskaču se
+        ordered = self._scores[np.argsort(codes, kind="stable")]
+        ordered = ordered[len(ordered) - counts.sum():]
+        return dict(zip(terms.tolist(), np.split(ordered, np.cumsum(counts)[:-1])))
+
+    def _get_all_term_stats(self) -> dict[str, dict]:
+        """Vraća statistiku svih termina iz sažetka po terminima."""
+        return self._cached("term_stats", self._compute_all_term_stats)
+
+    def _compute_all_term_stats(self) -> dict[str, dict]:
+        """Računa statistiku po terminima."""
+        grouped = self.get_term_summary()
 
-        passed = (term_df["ocjena"] >= 2).sum()
         return {
-            "count": len(term_df),
-            "avg_score": float(term_df["bodovi"].mean()),
-            "avg_grade": float(term_df["ocjena"].mean()),
-            "pass_rate": (passed / len(term_df)) * 100,
+            str(term): {
+                "count": int(count),
+                "avg_score": float(avg_score),
+                "avg_grade": float(avg_grade),
+                "pass_rate": float(pass_rate),
+            }
+            for term, count, avg_score, avg_grade, pass_rate in zip(
+                grouped.index,
+                grouped["count"],
+                grouped["avg_score"],
+                grouped["avg_grade"],
+                grouped["pass_rate"],
+            )
         }
 
     def filter_by_term(self, term: str) -> "ExamData":
@@ -124,25 +249,93 @@ class ExamData:
         ].copy()
         return ExamData(filtered_df, self._source_path)
 
+    def filter(
+        self,
+        term: str | None = None,
+        grade: int | None = None,
+        query: str = ""
+    ) -> "ExamData":
+        """
+        Primjenjuje sve filtere jednom kombiniranom maskom.
+
+        Args:
+            term: Termin (None za sve)
+            grade: Ocjena (None za sve)
+            query: Upit za ime ili prezime (prazan za sve)
+
+        Returns:
+            Novi ExamData objekt s filtriranim podacima
+        """
+        mask = np.ones(len(self._df), dtype=bool)
+
+        if term:
+            mask &= self._equals("termin", term)
+        if grade:
+            mask &= self._grades == grade
+        if query:
+            query = query.lower()
+            mask &= self._contains("ime", query) | self._contains("prezime", query)
+
+        # Booleovo indeksiranje već vraća kopiju - okvir se materijalizira samo jednom
+        return ExamData(self._df[mask], self._source_path)
+
+    def _equals(self, column: str, value: Any) -> np.ndarray:
+        """Vraća masku redova čiji je stupac jednak vrijednosti."""
+        series = self._df[column]
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Usporedba cjelobrojnih kodova (int8 za malo kategorija) umjesto stringova
+            code = series.cat.categories.get_indexer([value])[0]
+            if code < 0:
+                return np.zeros(len(series), dtype=bool)
+            return series.cat.codes.to_numpy() == code
+
+        return (series == value).to_numpy()
+
+    def _contains(self, column: str, query: str) -> np.ndarray:
+        """Vraća masku redova čiji stupac (bez obzira na velika slova) sadrži upit."""
+        series = self._df[column]
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Pretraži samo jedinstvene kategorije pa proširi preko kodova
+            categories = self._cached(
+                f"{column}_lower_categories",
+                lambda: series.cat.categories.str.lower(),
+            )
+            matches = np.append(categories.str.contains(query, regex=False), False)
+            # Kod -1 (nedostajuća vrijednost) pokazuje na dodani False
+            return matches[series.cat.codes.to_numpy()]
+
+        lowered = self._cached(f"{column}_lower", lambda: series.str.lower())
+        return lowered.str.contains(query, regex=False, na=False).to_numpy()
+
     def search(self, query: str) -> "ExamData":
         """Pretražuje po imenu ili prezimenu."""
         query = query.lower()
-        filtered_df = self._df[
-            self._df["ime"].str.lower().str.contains(query, na=False) |
-            self._df["prezime"].str.lower().str.contains(query, na=False)
-        ].copy()
+        mask = self._contains("ime", query) | self._contains("prezime", query)
+        filtered_df = self._df[mask].copy()
         return ExamData(filtered_df, self._source_path)
 
     def __iter__(self) -> Iterator[StudentRecord]:
         """Iterira kroz sve zapise."""
-        for _, row in self._df.iterrows():
+        # zip preko stupaca izbjegava kreiranje Series objekta za svaki red
+        df = self._df
+        columns = zip(
+            df["student_id"].tolist(),
+            df["ime"].tolist(),
+            df["prezime"].tolist(),
+            df["termin"].tolist(),
+            df["bodovi"].tolist(),
+            df["ocjena"].tolist(),
+        )
+        for student_id, first_name, last_name, term, score, grade in columns:
             yield StudentRecord(
-                student_id=int(row["student_id"]),
-                first_name=str(row["ime"]),
-                last_name=str(row["prezime"]),
-                term=str(row["termin"]),
-                score=int(row["bodovi"]),
-                grade=int(row["ocjena"]),
+                int(student_id),
+                str(first_name),
+                str(last_name),
+                str(term),
+                int(score),
+                int(grade),
             )
 
     def __len__(self) -> int:
@@ -150,6 +343,10 @@ class ExamData:
 
     def get_statistics(self) -> dict:
         """Vraća kompletnu statistiku."""
+        return self._cached("statistics", self._compute_statistics)
+
+    def _compute_statistics(self) -> dict:
+        """Računa kompletnu statistiku."""
         df = self._df
 
         # Prazan DataFrame - vrati default vrijednosti
@@ -169,19 +366,20 @@ class ExamData:
                 "term_stats": {},
             }
 
-        passed = (df["ocjena"] >= 2).sum()
+        scores = self._scores
+        passed = int(self._passed.sum())
 
         return {
             "count": len(df),
-            "avg_grade": float(df["ocjena"].mean()),
-            "avg_score": float(df["bodovi"].mean()),
-            "std_score": float(df["bodovi"].std()) if len(df) > 1 else 0.0,
-            "min_score": int(df["bodovi"].min()),
-            "max_score": int(df["bodovi"].max()),
-            "median_score": float(df["bodovi"].median()),
-            "pass_rate": (passed / len(df)) * 100,
-            "passed_count": int(passed),
-            "failed_count": len(df) - int(passed),
+            "avg_grade": self.average_grade,
+            "avg_score": self.average_score,
+            "std_score": float(scores.std(ddof=1)) if len(df) > 1 else 0.0,
+            "min_score": int(scores.min()),
+            "max_score": int(scores.max()),
+            "median_score": float(np.median(scores)),
+            "pass_rate": self.pass_rate,
+            "passed_count": passed,
+            "failed_count": len(df) - passed,
             "grade_distribution": self.get_grade_distribution(),
-            "term_stats": {term: self.get_term_stats(term) for term in self.terms},
+            "term_stats": self._get_all_term_stats(),
         }
@@ -1,10 +1,16 @@
 """Glavna GUI aplikacija."""
 
+import pickle
 import tkinter as tk
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
+from typing import Callable
+from matplotlib import rcParams
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.artist import Artist
 from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 
 from .. import __version__
 from ..config import Theme, ThemeManager, get_settings
@@ -22,6 +28,24 @@ from .widgets import (
     Tooltip,
 )
 
+# Odgoda (ms) nakon koje se niz promjena filtera primjenjuje odjednom;
+# pretragu već odgađa SearchBar dok korisnik tipka
+REFRESH_DELAY_MS = 150
+# Najveći broj zapamćenih kombinacija filtera
+FILTER_CACHE_SIZE = 32
+
+# Odgoda (ms) spremanja postavki - više promjena zaredom sprema se jednom
+SETTINGS_SAVE_DELAY_MS = 1000
+
+# DPI figure na ekranu; spremanje grafa koristi settings.default_dpi
+INTERACTIVE_DPI = 100
+
+# Bit Control tipke u event.state
+CONTROL_MASK = 0x4
+
+# ttk stilovi po imenu teme: (configure opcije, map opcije)
+_STYLE_CACHE: dict[str, tuple[dict[str, dict], dict[str, dict]]] = {}
+
 
 class Application(tk.Tk):
     """Glavna aplikacija za vizualizaciju podataka."""
@@ -29,6 +53,9 @@ class Application(tk.Tk):
     def __init__(self):
         super().__init__()
 
+        # Neočekivane greške iz svih callbacka prikazuju se na jednom mjestu
+        self.report_callback_exception = self._report_callback_exception
+
         self.settings = get_settings()
         self._theme = ThemeManager.get_current()
 
@@ -43,17 +70,44 @@ class Application(tk.Tk):
         self._term_filter: str | None = None
         self._grade_filter: int | None = None
         self._search_query: str = ""
+        # Rezultati filtriranja po (termin, ocjena, upit). Statistika se
+        # memoizira unutar svakog ExamData, pa ponovljeni upit ništa ne računa.
+        self._filter_cache: dict[tuple, ExamData | None] = {}
+        # ExamData trenutno učitan u tablicu
+        self._table_source: ExamData | None = None
+        self._refresh_pending: str | None = None
         self.generator = DataGenerator()
         self.graph_manager = GraphManager()
+        self._available_graphs = GraphManager.get_available_graphs()
+
+        # Pozadinska dretva za učitavanje, generiranje i izvoz. Jedan worker
+        # izvršava poslove redom, pa generator i podaci nisu dijeljeni između dretvi.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._settings_save_pending: str | None = None
+        self._settings_future: Future | None = None
 
         # Canvas i figure
         self.canvas: FigureCanvasTkAgg | None = None
         self.current_fig: Figure | None = None
+        # Figura po nazivu grafa - povratak na već nacrtan graf samo zamijeni
+        # figuru canvasa (GraphManager.is_current provjerava podatke i temu)
+        self._graph_figs: dict[str, Figure] = {}
+        # Tight bbox zadnjeg iscrtavanja; savefig tada ne radi dodatni prolaz
+        self._tight_bbox: Bbox | None = None
+        # Zakazano crtanje grafa - više zahtjeva zaredom crta se jednom
+        self._pending_graph_draw: str | None = None
+        # Blitting: artisti koji se crtaju preko spremljene pozadine
+        self._blit_artists: list[Artist] = []
+        self._blit_background = None
         self.current_graph = tk.StringVar()
 
         # View mode
         self.view_mode = tk.StringVar(value="graph")  # "graph" ili "table"
 
+        # Widgeti kojima tema mijenja boje: (widget, {opcija: atribut teme}),
+        # registriraju se pri kreiranju
+        self._themed_widgets: list[tuple[tk.Misc, dict[str, str]]] = []
+
         self._setup_window()
         self._configure_styles()
         self._create_ui()
@@ -64,12 +118,23 @@ class Application(tk.Tk):
         # Generiraj početne podatke
         self._generate_and_display()
 
+    def _report_callback_exception(self, exc_type, exc_value, exc_tb):
+        """Prikazuje neočekivanu grešku iz Tk callbacka."""
+        # Puni traceback ide u konzolu, korisnik vidi samo opis greške
+        traceback.print_exception(exc_type, exc_value, exc_tb)
+
+        if hasattr(self, 'status_bar'):
+            self.status_bar.set_status("Neočekivana greška", "error")
+        message = "".join(traceback.format_exception_only(exc_type, exc_value)).strip()
+        messagebox.showerror("Greška", f"Neočekivana greška:\n{message}")
+
     def _setup_window(self):
         """Postavlja prozor."""
         self.title(f"CSV Visualizer v{__version__} - Vizualizacija rezultata ispita")
         self.geometry(f"{self.settings.window_width}x{self.settings.window_height}")
         self.minsize(self.settings.min_width, self.settings.min_height)
         self.configure(bg=self._theme.bg_primary)
+        self._themed(self, bg="bg_primary")
 
         # Ikona (ako postoji)
         try:
@@ -77,54 +142,68 @@ class Application(tk.Tk):
         except tk.TclError:
             pass
 
+    @staticmethod
+    def _build_styles(theme: Theme) -> dict[str, dict]:
+        """Gradi konfiguraciju ttk stilova za temu ({stil: opcije})."""
+        return {
+            "TFrame": {"background": theme.bg_primary},
+            "TLabel": {"background": theme.bg_primary, "foreground": theme.fg_primary},
+            "TLabelframe": {"background": theme.bg_primary},
+            "TLabelframe.Label": {
+                "background": theme.bg_primary,
+                "foreground": theme.fg_primary,
+                "font": ("Segoe UI", 11, "bold"),
+            },
+            "TCombobox": {
+                "fieldbackground": theme.bg_primary,
+                "background": theme.bg_secondary,
+                "foreground": theme.fg_primary,
+                "arrowcolor": theme.fg_primary,
+                "padding": 8,
+            },
+            # Header stil
+            "Header.TLabel": {
+                "font": ("Segoe UI", 18, "bold"),
+                "foreground": theme.accent,
+                "background": theme.bg_primary,
+            },
+            # Subtitle stil
+            "Subtitle.TLabel": {
+                "font": ("Segoe UI", 11),
+                "foreground": theme.fg_muted,
+                "background": theme.bg_primary,
+            },
+        }
+
+    @staticmethod
+    def _build_style_maps(theme: Theme) -> dict[str, dict]:
+        """Gradi dinamičke (state) mape ttk stilova za temu."""
+        return {
+            "TCombobox": {
+                "fieldbackground": [("readonly", theme.bg_primary)],
+                "selectbackground": [("readonly", theme.accent)],
+                "selectforeground": [("readonly", theme.btn_primary_fg)],
+            },
+        }
+
     def _configure_styles(self):
         """Konfigurira ttk stilove."""
         style = ttk.Style()
-        style.theme_use("clam")
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
 
         theme = self._theme
+        if theme.name not in _STYLE_CACHE:
+            _STYLE_CACHE[theme.name] = (
+                self._build_styles(theme),
+                self._build_style_maps(theme),
+            )
+        styles, style_maps = _STYLE_CACHE[theme.name]
 
-        style.configure("TFrame", background=theme.bg_primary)
-        style.configure("TLabel", background=theme.bg_primary, foreground=theme.fg_primary)
-        style.configure("TLabelframe", background=theme.bg_primary)
-        style.configure(
-            "TLabelframe.Label",
-            background=theme.bg_primary,
-            foreground=theme.fg_primary,
-            font=("Segoe UI", 11, "bold")
-        )
-
-        style.configure(
-            "TCombobox",
-            fieldbackground=theme.bg_primary,
-            background=theme.bg_secondary,
-            foreground=theme.fg_primary,
-            arrowcolor=theme.fg_primary,
-            padding=8,
-        )
-
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", theme.bg_primary)],
-            selectbackground=[("readonly", theme.accent)],
-            selectforeground=[("readonly", theme.btn_primary_fg)],
-        )
-
-        # Header stil
-        style.configure(
-            "Header.TLabel",
-            font=("Segoe UI", 18, "bold"),
-            foreground=theme.accent,
-            background=theme.bg_primary,
-        )
-
-        # Subtitle stil
-        style.configure(
-            "Subtitle.TLabel",
-            font=("Segoe UI", 11),
-            foreground=theme.fg_muted,
-            background=theme.bg_primary,
-        )
+        for name, options in styles.items():
+            style.configure(name, **options)
+        for name, options in style_maps.items():
+            style.map(name, **options)
 
     def _create_ui(self):
         """Kreira korisničko sučelje."""
@@ -132,6 +211,7 @@ class Application(tk.Tk):
 
         # Glavni container
         self.main_frame = tk.Frame(self, bg=theme.bg_primary, padx=20, pady=15)
+        self._themed(self.main_frame, bg="bg_primary")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Header
@@ -139,6 +219,7 @@ class Application(tk.Tk):
 
         # Content area (lijevo + desno)
         content = tk.Frame(self.main_frame, bg=theme.bg_primary)
+        self._themed(content, bg="bg_primary")
         content.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
 
         # Lijevi panel (kontrole)
@@ -153,15 +234,27 @@ class Application(tk.Tk):
         # Keyboard shortcuts
         self._setup_shortcuts()
 
+    def _themed(self, widget, **options: str):
+        """
+        Registrira widget kojem promjena teme mijenja boje.
+
+        Args:
+            widget: Widget za registraciju
+            **options: Opcija widgeta -> naziv atributa teme (npr. bg="bg_primary")
+        """
+        self._themed_widgets.append((widget, options))
+
     def _create_header(self):
         """Kreira header s naslovom i theme toggleom."""
         theme = self._theme
 
         self.header_frame = tk.Frame(self.main_frame, bg=theme.bg_primary)
+        self._themed(self.header_frame, bg="bg_primary")
         self.header_frame.pack(fill=tk.X)
 
         # Lijeva strana - naslov
         self.title_frame = tk.Frame(self.header_frame, bg=theme.bg_primary)
+        self._themed(self.title_frame, bg="bg_primary")
         self.title_frame.pack(side=tk.LEFT)
 
         self.title_label = ttk.Label(
@@ -188,15 +281,18 @@ class Application(tk.Tk):
         theme = self._theme
 
         left_panel = tk.Frame(parent, bg=theme.bg_secondary, width=340)
+        self._themed(left_panel, bg="bg_secondary")
         left_panel.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 15))
         left_panel.pack_propagate(False)
 
         # Padding unutar panela
         inner = tk.Frame(left_panel, bg=theme.bg_secondary, padx=15, pady=15)
+        self._themed(inner, bg="bg_secondary")
         inner.pack(fill=tk.BOTH, expand=True)
 
         # === Odabir grafa ===
         graph_section = tk.Frame(inner, bg=theme.bg_secondary)
+        self._themed(graph_section, bg="bg_secondary")
         graph_section.pack(fill=tk.X, pady=(0, 15))
 
         graph_label = tk.Label(
@@ -206,21 +302,23 @@ class Application(tk.Tk):
             bg=theme.bg_secondary,
             fg=theme.fg_primary
         )
+        self._themed(graph_label, bg="bg_secondary", fg="fg_primary")
         graph_label.pack(anchor="w", pady=(0, 8))
 
         self.combo_graph = ttk.Combobox(
             graph_section,
             textvariable=self.current_graph,
             state="readonly",
-            values=GraphManager.get_available_graphs(),
+            values=self._available_graphs,
             font=("Segoe UI", 10)
         )
         self.combo_graph.pack(fill=tk.X)
         self.combo_graph.current(0)
-        self.combo_graph.bind("<<ComboboxSelected>>", lambda e: self._display_graph())
+        self.combo_graph.bind("<<ComboboxSelected>>", lambda e: self._request_graph_draw())
 
         # === View mode toggle ===
         view_section = tk.Frame(inner, bg=theme.bg_secondary)
+        self._themed(view_section, bg="bg_secondary")
         view_section.pack(fill=tk.X, pady=15)
 
         view_label = tk.Label(
@@ -230,9 +328,11 @@ class Application(tk.Tk):
             bg=theme.bg_secondary,
             fg=theme.fg_primary
         )
+        self._themed(view_label, bg="bg_secondary", fg="fg_primary")
         view_label.pack(anchor="w", pady=(0, 8))
 
         view_btns = tk.Frame(view_section, bg=theme.bg_secondary)
+        self._themed(view_btns, bg="bg_secondary")
         view_btns.pack(fill=tk.X)
 
         self.btn_graph_view = ModernButton(
@@ -253,6 +353,7 @@ class Application(tk.Tk):
 
         # === Akcije ===
         action_section = tk.Frame(inner, bg=theme.bg_secondary)
+        self._themed(action_section, bg="bg_secondary")
         action_section.pack(fill=tk.X, pady=15)
 
         action_label = tk.Label(
@@ -262,6 +363,7 @@ class Application(tk.Tk):
             bg=theme.bg_secondary,
             fg=theme.fg_primary
         )
+        self._themed(action_label, bg="bg_secondary", fg="fg_primary")
         action_label.pack(anchor="w", pady=(0, 8))
 
         self.btn_generate = ModernButton(
@@ -299,6 +401,7 @@ class Application(tk.Tk):
 
         # === Statistika ===
         stats_section = tk.Frame(inner, bg=theme.bg_secondary)
+        self._themed(stats_section, bg="bg_secondary")
         stats_section.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
 
         stats_label = tk.Label(
@@ -308,9 +411,11 @@ class Application(tk.Tk):
             bg=theme.bg_secondary,
             fg=theme.fg_primary
         )
+        self._themed(stats_label, bg="bg_secondary", fg="fg_primary")
         stats_label.pack(anchor="w", pady=(0, 8))
 
         self.stats_panel = StatsPanel(stats_section)
+        self._themed(self.stats_panel, bg="bg_secondary")
         self.stats_panel.pack(fill=tk.BOTH, expand=True)
 
         self.left_panel = left_panel
@@ -321,10 +426,12 @@ class Application(tk.Tk):
         theme = self._theme
 
         right_panel = tk.Frame(parent, bg=theme.bg_primary)
+        self._themed(right_panel, bg="bg_primary")
         right_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Toolbar s filterima (za tablicu)
         self.toolbar_frame = tk.Frame(right_panel, bg=theme.bg_secondary)
+        self._themed(self.toolbar_frame, bg="bg_secondary")
 
         # Filter panel
         self.filter_panel = FilterPanel(
@@ -347,10 +454,20 @@ class Application(tk.Tk):
             highlightthickness=1,
             highlightbackground=theme.border
         )
+        self._themed(self.graph_frame, bg="bg_secondary", highlightbackground="border")
         self.graph_frame.pack(fill=tk.BOTH, expand=True)
 
+        # Jedna trajna figura i canvas - grafovi se crtaju u njih
+        # DPI je fiksan - visoki figure.dpi iz matplotlibrc bi povećao početni
+        # canvas i svaki raster na ekranu
+        self.current_fig = Figure(figsize=(8, 5), dpi=INTERACTIVE_DPI)
+        self.canvas = FigureCanvasTkAgg(self.current_fig, master=self.graph_frame)
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
         # Container za tablicu (inicijalno skriven)
         self.table_frame = tk.Frame(right_panel, bg=theme.bg_secondary)
+        self._themed(self.table_frame, bg="bg_secondary")
         self.data_table = DataTable(self.table_frame)
         self.data_table.pack(fill=tk.BOTH, expand=True)
 
@@ -366,7 +483,7 @@ class Application(tk.Tk):
             self.toolbar_frame.pack_forget()
             self.table_frame.pack_forget()
             self.graph_frame.pack(fill=tk.BOTH, expand=True)
-            self._display_graph()
+            self._request_graph_draw()
         else:
             self.btn_graph_view.primary = False
             self.btn_table_view.primary = True
@@ -379,39 +496,110 @@ class Application(tk.Tk):
         self.btn_graph_view._apply_theme()
         self.btn_table_view._apply_theme()
 
-    def _generate_data(self) -> bool:
-        """Generira nove podatke."""
-        if hasattr(self, 'status_bar'):
-            self.status_bar.set_status("Generiram podatke...", "info")
-            self.update_idletasks()
+    def _run_in_background(
+        self, task: Callable, on_done: Callable[[Future], None]
+    ) -> Future:
+        """
+        Izvršava zadatak u pozadinskoj dretvi.
+
+        Tk i matplotlib nisu thread-safe, pa se gotov Future ne predaje iz
+        workera nego ga Tk dretva periodički provjerava i poziva on_done.
+        """
+        future = self._executor.submit(task)
+        self._poll_future(future, on_done)
+        return future
+
+    def _poll_future(self, future: Future, on_done: Callable[[Future], None]):
+        """Čeka završetak Future objekta bez blokiranja event petlje."""
+        if future.done():
+            on_done(future)
+        else:
+            self.after(30, self._poll_future, future, on_done)
 
-        try:
-            self.data = self.generator.generate_and_save()
-            self._filtered_data = None
-            self._term_filter = None
-            self._grade_filter = None
-            self._search_query = ""
-            self._update_stats()
-            self._update_filter_terms()
-            self._update_status_bar()
+    def _save_settings(self):
+        """Zakazuje spremanje postavki; zahtjevi unutar odgode se spajaju."""
+        if self._settings_save_pending is None:
+            self._settings_save_pending = self.after(
+                SETTINGS_SAVE_DELAY_MS, self._flush_settings
+            )
 
+    def _flush_settings(self):
+        """Sprema snimku postavki u pozadinskoj dretvi."""
+        self._settings_save_pending = None
+        data = self.settings.to_dict()
+        self._settings_future = self._run_in_background(
+            lambda: self.settings.save(data), self._on_settings_saved
+        )
+
+    def _on_settings_saved(self, future: Future):
+        """Javlja grešku spremanja postavki (Tk dretva)."""
+        if future.cancelled():
+            # Spremanje je preuzeo destroy()
+            return
+        try:
+            future.result()
+        except OSError as e:
             if hasattr(self, 'status_bar'):
-                self.status_bar.set_status("Podaci uspješno generirani", "success")
+                self.status_bar.set_status(f"Postavke nisu spremljene: {e}", "warning")
+
+    def _set_data(self, data: ExamData):
+        """Postavlja nove podatke, resetira filtere i osvježava prikaz."""
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
+
+        self.data = data
+        self._filter_cache.clear()
+        self._filtered_data = None
+        self._term_filter = None
+        self._grade_filter = None
+        self._search_query = ""
+        self.filter_panel.reset_selection()
+        self._update_stats()
+        self._update_filter_terms()
+        self._update_status_bar()
+
+        if self.view_mode.get() == "graph":
+            self._request_graph_draw()
+        else:
+            self._display_table()
+
+    def _generate_and_display(self):
+        """Generira podatke u pozadini i prikazuje graf."""
+        if hasattr(self, 'status_bar'):
+            self.status_bar.set_status("Generiram podatke...", "info")
+
+        self._run_in_background(self.generator.generate, self._on_data_generated)
 
-            return True
-        except (IOError, ValueError, RuntimeError) as e:
+    def _on_data_generated(self, future: Future):
+        """Prikazuje generirane podatke (Tk dretva)."""
+        try:
+            data = future.result()
+        except (ValueError, RuntimeError) as e:
             if hasattr(self, 'status_bar'):
                 self.status_bar.set_status("Greška pri generiranju", "error")
             messagebox.showerror("Greška", f"Greška pri generiranju:\n{e}")
-            return False
+            return
 
-    def _generate_and_display(self):
-        """Generira podatke i prikazuje graf."""
-        if self._generate_data():
-            if self.view_mode.get() == "graph":
-                self._display_graph()
-            else:
-                self._display_table()
+        self._set_data(data)
+
+        if hasattr(self, 'status_bar'):
+            self.status_bar.set_status("Podaci uspješno generirani", "success")
+
+        # Podaci se prikazuju odmah; CSV se sprema naknadno u pozadini
+        path = self.settings.default_csv_path
+        self._run_in_background(
+            lambda: DataLoader.save_csv(data.dataframe, path),
+            self._on_generated_saved,
+        )
+
+    def _on_generated_saved(self, future: Future):
+        """Javlja grešku spremanja generiranih podataka (Tk dretva)."""
+        try:
+            future.result()
+        except OSError as e:
+            if hasattr(self, 'status_bar'):
+                self.status_bar.set_status(f"Generirani podaci nisu spremljeni: {e}", "warning")
 
     def _load_csv(self):
         """Učitava CSV datoteku."""
@@ -427,43 +615,55 @@ class Application(tk.Tk):
         if not path:
             return
 
-        try:
-            self.data = DataLoader.load(path)
-            self._filtered_data = None
-            self._term_filter = None
-            self._grade_filter = None
-            self._search_query = ""
-            self.settings.last_opened_path = path
-            self.settings.save()
-            self._update_stats()
-            self._update_filter_terms()
-            self._update_status_bar()
-
-            if self.view_mode.get() == "graph":
-                self._display_graph()
-            else:
-                self._display_table()
-
-            if hasattr(self, 'status_bar'):
-                self.status_bar.set_status(f"Učitano {len(self.data)} zapisa", "success")
+        if hasattr(self, 'status_bar'):
+            self.status_bar.set_status("Učitavam CSV...", "info")
 
-            messagebox.showinfo(
-                "Uspjeh",
-                f"Učitano {len(self.data)} zapisa iz:\n{path}"
-            )
+        self._run_in_background(
+            lambda: DataLoader.load(path),
+            lambda future: self._on_csv_loaded(future, path)
+        )
 
+    def _on_csv_loaded(self, future: Future, path: str):
+        """Prikazuje učitane podatke ili grešku (Tk dretva)."""
+        try:
+            data = future.result()
         except FileNotFoundError as e:
             if hasattr(self, 'status_bar'):
                 self.status_bar.set_status("Datoteka nije pronađena", "error")
             messagebox.showerror("Greška", str(e))
+            return
         except DataValidationError as e:
             if hasattr(self, 'status_bar'):
                 self.status_bar.set_status("Greška validacije podataka", "error")
             messagebox.showerror("Greška validacije", str(e))
-        except Exception as e:
+            return
+        except (OSError, ValueError) as e:
             if hasattr(self, 'status_bar'):
-                self.status_bar.set_status("Neočekivana greška", "error")
-            messagebox.showerror("Greška", f"Neočekivana greška:\n{e}")
+                self.status_bar.set_status("Greška pri učitavanju", "error")
+            messagebox.showerror("Greška", f"Greška pri učitavanju:\n{e}")
+            return
+
+        self.settings.last_opened_path = path
+        self._save_settings()
+        self._set_data(data)
+
+        if hasattr(self, 'status_bar'):
+            self.status_bar.set_status(f"Učitano {len(self.data)} zapisa", "success")
+
+        messagebox.showinfo(
+            "Uspjeh",
+            f"Učitano {len(self.data)} zapisa iz:\n{path}"
+        )
+
+    def _request_graph_draw(self):
+        """Zakazuje crtanje grafa kad se event petlja isprazni."""
+        if self._pending_graph_draw is None:
+            self._pending_graph_draw = self.after_idle(self._do_graph_draw)
+
+    def _do_graph_draw(self):
+        """Crta zakazani graf."""
+        self._pending_graph_draw = None
+        self._display_graph()
 
     def _display_graph(self):
         """Prikazuje odabrani graf."""
@@ -473,35 +673,117 @@ class Application(tk.Tk):
 
         graph_name = self.current_graph.get()
         if not graph_name:
-            graph_name = GraphManager.get_available_graphs()[0]
+            graph_name = self._available_graphs[0]
+
+        fig = self._figure_for(graph_name)
+
+        # Figura već prikazuje ovaj graf za iste podatke i temu (npr. povratak iz
+        # tablice ili na prije prikazan graf) - nema što crtati, samo se prikazuje
+        if self.graph_manager.is_current(fig, graph_name, data):
+            if fig is not self.current_fig:
+                self._show_figure(fig)
+                self.canvas.draw_idle()
+            return
+
+        if fig is not self.current_fig:
+            self._show_figure(fig)
+
+        # Isti graf s novim podacima - zamijeni samo podatke i blitaj; ako se
+        # promijenila i os (prazna lista), figura se iscrtava cijela
+        artists = self.graph_manager.update_in_place(self.current_fig, graph_name, data)
+        if artists:
+            self._blit(artists)
+            return
+        if artists is not None:
+            self._reset_blit()
+            self.canvas.draw_idle()
+            return
 
+        self._reset_blit()
         try:
-            fig = self.graph_manager.get_graph_by_name(graph_name, data)
+            self.graph_manager.render_into(self.current_fig, graph_name, data)
         except ValueError as e:
             messagebox.showerror("Greška", str(e))
             return
 
-        # Očisti prethodni canvas
-        if self.canvas is not None:
-            self.canvas.get_tk_widget().destroy()
-            if self.current_fig is not None:
-                plt.close(self.current_fig)
-            self.canvas = None
+        # draw_idle spaja uzastopne zahtjeve u jedno crtanje u idle petlji
+        self.canvas.draw_idle()
 
+    def _figure_for(self, graph_name: str) -> Figure:
+        """Vraća figuru grafa, kreira je pri prvom prikazu."""
+        fig = self._graph_figs.get(graph_name)
+        if fig is None:
+            if not self._graph_figs:
+                # Prvi graf koristi figuru kreiranu s canvasom
+                fig = self.current_fig
+            else:
+                fig = Figure(figsize=(8, 5), dpi=INTERACTIVE_DPI)
+                # DPI uključuje omjer piksela ekrana koji je canvas postavio
+                fig.dpi = self.current_fig.dpi
+            self._graph_figs[graph_name] = fig
+        return fig
+
+    def _show_figure(self, fig: Figure):
+        """Postavlja figuru u canvas, u veličini canvasa."""
+        # Blitani artisti figure koja odlazi moraju se opet crtati normalno,
+        # inače ih puno iscrtavanje pri povratku na nju preskače
+        self._reset_blit()
+
+        width, height = self.canvas.get_width_height(physical=True)
+        fig.set_size_inches(width / fig.dpi, height / fig.dpi, forward=False)
+        fig.set_canvas(self.canvas)
+        self.canvas.figure = fig
         self.current_fig = fig
-        self.canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-        self.canvas.draw()
 
-        widget = self.canvas.get_tk_widget()
-        widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._tight_bbox = None
+
+    def _blit(self, artists: list[Artist]):
+        """Crta promijenjene artiste preko spremljene pozadine grafa."""
+        if self._blit_background is None or artists != self._blit_artists:
+            # Animirani artisti se ne crtaju u pozadinu; draw_event je sprema
+            self._reset_blit()
+            for artist in artists:
+                artist.set_animated(True)
+            self._blit_artists = artists
+            self.canvas.draw()
+            return
+
+        self._tight_bbox = None
+        self.canvas.restore_region(self._blit_background)
+        self._draw_blit_artists()
+        self.canvas.blit(self.current_fig.bbox)
+
+    def _reset_blit(self):
+        """
+        Završava blitting: artisti se vraćaju u obično crtanje.
+
+        Poziva se prije svakog iscrtavanja koje ne ide preko _blit - puno
+        iscrtavanje inače preskače animirane artiste.
+        """
+        for artist in self._blit_artists:
+            artist.set_animated(False)
+        self._blit_artists = []
+        self._blit_background = None
+
+    def _draw_blit_artists(self):
+        """Crta animirane artiste u buffer canvasa."""
+        for artist in self._blit_artists:
+            self.current_fig.draw_artist(artist)
 
     def _display_table(self):
         """Prikazuje tablicu s podacima."""
         data = self._filtered_data or self.data
         if data is None:
+            self._table_source = None
             self.data_table.clear()
             return
 
+        # Isti podaci su već u tablici (npr. povratak iz prikaza grafa) -
+        # ne učitavaj ih ponovno i zadrži poziciju i sortiranje
+        if data is self._table_source:
+            return
+
+        self._table_source = data
         self.data_table.load_data(data.dataframe)
 
     def _apply_filters(self):
@@ -510,46 +792,57 @@ class Application(tk.Tk):
             self._filtered_data = None
             return
 
-        filtered = self.data
-
-        # Primijeni filter po terminu
-        if self._term_filter:
-            filtered = filtered.filter_by_term(self._term_filter)
+        key = (self._term_filter, self._grade_filter, self._search_query)
+        if key not in self._filter_cache:
+            if len(self._filter_cache) >= FILTER_CACHE_SIZE:
+                # Izbaci najstariji unos
+                del self._filter_cache[next(iter(self._filter_cache))]
+            self._filter_cache[key] = self._filter_data()
 
-        # Primijeni filter po ocjeni
-        if self._grade_filter:
-            filtered = filtered.filter_by_grade(self._grade_filter)
-
-        # Primijeni pretragu po imenu
-        if self._search_query:
-            filtered = filtered.search(self._search_query)
+        self._filtered_data = self._filter_cache[key]
+        self._update_status_bar()
 
+    def _filter_data(self) -> ExamData | None:
+        """Filtrira podatke; vraća None ako nijedan filter nije aktivan."""
         # Ako nema filtera, koristi originalne podatke
         if not self._term_filter and not self._grade_filter and not self._search_query:
-            self._filtered_data = None
-        else:
-            self._filtered_data = filtered
+            return None
 
-        self._update_status_bar()
+        return self.data.filter(
+            term=self._term_filter,
+            grade=self._grade_filter,
+            query=self._search_query,
+        )
 
     def _on_filter(self, term: str | None, grade: int | None):
         """Handler za filtriranje po terminu/ocjeni."""
         self._term_filter = term
         self._grade_filter = grade
-        self._apply_filters()
-
-        if self.view_mode.get() == "table":
-            self._display_table()
-
-        self._update_stats()
+        self._schedule_refresh()
 
     def _on_search(self, query: str):
         """Handler za pretraživanje."""
+        if query == self._search_query:
+            return
+
         self._search_query = query
+        self._schedule_refresh(delay=0)
+
+    def _schedule_refresh(self, delay: int = REFRESH_DELAY_MS):
+        """Zakazuje osvježavanje; novi događaj poništava ono koje još čeka."""
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.after(delay, self._do_refresh)
+
+    def _do_refresh(self):
+        """Primjenjuje filtere i osvježava prikaz i statistiku."""
+        self._refresh_pending = None
         self._apply_filters()
 
         if self.view_mode.get() == "table":
             self._display_table()
+        else:
+            self._request_graph_draw()
 
         self._update_stats()
 
@@ -570,7 +863,7 @@ class Application(tk.Tk):
 
     def _save_graph(self):
         """Sprema graf kao sliku."""
-        if self.current_fig is None:
+        if self.current_fig is None or not self.current_fig.axes:
             messagebox.showwarning("Upozorenje", "Nema grafa za spremanje.")
             return
 
@@ -589,21 +882,50 @@ class Application(tk.Tk):
         if not path:
             return
 
+        # Worker sprema kopiju figure - canvas i dalje crta original na Tk dretvi
+        snapshot = pickle.dumps(self.current_fig)
+        bbox = self._get_tight_bbox()
+        dpi = self.settings.default_dpi
+        facecolor = self.current_fig.get_facecolor()
+
+        def save():
+            fig = pickle.loads(snapshot)
+            # savefig preskače animirane (blitane) artiste
+            for artist in fig.findobj(lambda a: a.get_animated()):
+                artist.set_animated(False)
+            fig.savefig(path, dpi=dpi, bbox_inches=bbox, facecolor=facecolor)
+
+        self._run_in_background(save, lambda future: self._on_graph_saved(future, path))
+
+    def _on_graph_saved(self, future: Future, path: str):
+        """Javlja rezultat spremanja grafa (Tk dretva)."""
         try:
-            self.current_fig.savefig(
-                path,
-                dpi=self.settings.default_dpi,
-                bbox_inches="tight",
-                facecolor=self.current_fig.get_facecolor()
-            )
+            future.result()
             self.settings.last_save_path = path
-            self.settings.save()
+            self._save_settings()
             messagebox.showinfo("Uspjeh", f"Graf spremljen u:\n{path}")
-        except Exception as e:
+        except (OSError, ValueError) as e:
             messagebox.showerror("Greška", f"Greška pri spremanju:\n{e}")
 
+    def _on_canvas_draw(self, event):
+        """Nakon punog iscrtavanja poništava tight bbox i sprema pozadinu za blitting."""
+        self._tight_bbox = None
+
+        if self._blit_artists:
+            self._blit_background = self.canvas.copy_from_bbox(self.current_fig.bbox)
+            self._draw_blit_artists()
+
+    def _get_tight_bbox(self) -> Bbox:
+        """Vraća tight bbox figure (u inčima), računa ga samo ako je zastario."""
+        if self._tight_bbox is None:
+            renderer = self.canvas.get_renderer()
+            self._tight_bbox = self.current_fig.get_tightbbox(renderer).padded(
+                rcParams["savefig.pad_inches"]
+            )
+        return self._tight_bbox
+
     def _export_data(self):
-        """Izvozi podatke u CSV datoteku."""
+        """Izvozi podatke u CSV, Excel ili Parquet datoteku."""
         data = self._filtered_data or self.data
         if data is None:
             messagebox.showwarning("Upozorenje", "Nema podataka za izvoz.")
@@ -615,6 +937,7 @@ class Application(tk.Tk):
             filetypes=[
                 ("CSV datoteka", "*.csv"),
                 ("Excel datoteka", "*.xlsx"),
+                ("Parquet datoteka", "*.parquet"),
             ],
             initialdir=self.settings.last_save_path or "."
         )
@@ -622,73 +945,90 @@ class Application(tk.Tk):
         if not path:
             return
 
-        try:
+        filter_info = ""
+        if self._filtered_data:
+            filter_info = f"\n(Filtrirano: {len(data)} od {len(self.data)} zapisa)"
+
+        def write():
             if path.endswith(".xlsx"):
                 data.dataframe.to_excel(path, index=False, engine="openpyxl")
+            elif path.endswith(".parquet"):
+                # Stupčani binarni format - čuva tipove (kategorije, int8) bez parsiranja
+                data.dataframe.to_parquet(path, index=False, engine="pyarrow")
             else:
-                data.dataframe.to_csv(path, index=False, encoding="utf-8")
+                DataLoader.save_csv(data.dataframe, path)
 
-            self.settings.last_save_path = path
-            self.settings.save()
+        self._run_in_background(
+            write,
+            lambda future: self._on_data_exported(future, path, filter_info)
+        )
 
-            filter_info = ""
-            if self._filtered_data:
-                filter_info = f"\n(Filtrirano: {len(data)} od {len(self.data)} zapisa)"
+    def _on_data_exported(self, future: Future, path: str, filter_info: str):
+        """Javlja rezultat izvoza podataka (Tk dretva)."""
+        try:
+            future.result()
+
+            self.settings.last_save_path = path
+            self._save_settings()
 
             messagebox.showinfo(
                 "Uspjeh",
                 f"Podaci izvezeni u:\n{path}{filter_info}"
             )
         except ImportError:
-            # openpyxl nije instaliran
+            # openpyxl ili pyarrow nije instaliran
             if path.endswith(".xlsx"):
                 messagebox.showerror(
                     "Greška",
                     "Za izvoz u Excel format potrebno je instalirati 'openpyxl'.\n\n"
                     "Instalirajte s: pip install openpyxl"
                 )
-        except Exception as e:
+            elif path.endswith(".parquet"):
+                messagebox.showerror(
+                    "Greška",
+                    "Za izvoz u Parquet format potrebno je instalirati 'pyarrow'.\n\n"
+                    "Instalirajte s: pip install pyarrow"
+                )
+        except (OSError, ValueError) as e:
             messagebox.showerror("Greška", f"Greška pri izvozu:\n{e}")
 
     def _on_theme_change(self, theme: Theme):
         """Handler za promjenu teme."""
+        # Ponovljena obavijest o istoj temi ne mijenja ništa
+        if theme.name == self._theme.name:
+            return
+
+        old_theme = self._theme
         self._theme = theme
 
         # Spremi postavku
         self.settings.theme = theme.name
-        self.settings.save()
+        self._save_settings()
 
         # Ažuriraj stilove
         self._configure_styles()
 
-        # Ažuriraj pozadine
-        self.configure(bg=theme.bg_primary)
-        self.main_frame.configure(bg=theme.bg_primary)
-        self.header_frame.configure(bg=theme.bg_primary)
-        self.title_frame.configure(bg=theme.bg_primary)
-        self.left_panel.configure(bg=theme.bg_secondary)
-        self.left_inner.configure(bg=theme.bg_secondary)
-        self.right_panel.configure(bg=theme.bg_primary)
-        self.toolbar_frame.configure(bg=theme.bg_secondary)
-        self.graph_frame.configure(
-            bg=theme.bg_secondary,
-            highlightbackground=theme.border
-        )
-        self.table_frame.configure(bg=theme.bg_secondary)
-
-        # Ažuriraj labele u lijevom panelu
-        for widget in self.left_inner.winfo_children():
-            if isinstance(widget, tk.Frame):
-                widget.configure(bg=theme.bg_secondary)
-                for child in widget.winfo_children():
-                    if isinstance(child, tk.Label):
-                        child.configure(bg=theme.bg_secondary, fg=theme.fg_primary)
-                    elif isinstance(child, tk.Frame):
-                        child.configure(bg=theme.bg_secondary)
-
-        # Ponovno prikaži graf s novom temom
+        # Ažuriraj pozadine i labele
+        for widget, options in self._themed_widgets:
+            widget.configure(**{
+                option: getattr(theme, attr) for option, attr in options.items()
+            })
+
+        # Skriveni grafovi se crtaju ispočetka kad se ponovno prikažu
+        for fig in self._graph_figs.values():
+            if fig is not self.current_fig:
+                self.graph_manager.invalidate(fig)
+
+        # Zamijeni boje postojećeg grafa; ponovno crtanje samo ako to ne uspije
         if self.view_mode.get() == "graph" and self.data:
-            self._display_graph()
+            if self.graph_manager.retheme(self.current_fig, old_theme):
+                self._reset_blit()
+                self.canvas.draw_idle()
+            else:
+                self.graph_manager.invalidate(self.current_fig)
+                self._request_graph_draw()
+        else:
+            self.graph_manager.invalidate(self.current_fig)
 
     def _create_status_bar(self):
         """Kreira status bar na dnu prozora."""
@@ -697,34 +1037,44 @@ class Application(tk.Tk):
 
     def _setup_shortcuts(self):
         """Postavlja keyboard shortcuts."""
-        # Ctrl+G - Generiraj podatke
-        self.bind("<Control-g>", lambda e: self._generate_and_display())
-
-        # Ctrl+O - Učitaj CSV
-        self.bind("<Control-o>", lambda e: self._load_csv())
-
-        # Ctrl+S - Spremi graf
-        self.bind("<Control-s>", lambda e: self._save_graph())
-
-        # Ctrl+E - Izvezi podatke
-        self.bind("<Control-e>", lambda e: self._export_data())
-
-        # Ctrl+T - Promijeni temu
-        self.bind("<Control-t>", lambda e: ThemeManager.toggle())
-
-        # F5 - Refresh (generiraj nove podatke)
-        self.bind("<F5>", lambda e: self._generate_and_display())
+        # (Ctrl pritisnut, keysym) -> handler
+        self._shortcut_map: dict[tuple[bool, str], Callable[[], object]] = {
+            # Ctrl+G - Generiraj podatke
+            (True, "g"): self._generate_and_display,
+            # Ctrl+O - Učitaj CSV
+            (True, "o"): self._load_csv,
+            # Ctrl+S - Spremi graf
+            (True, "s"): self._save_graph,
+            # Ctrl+E - Izvezi podatke
+            (True, "e"): self._export_data,
+            # Ctrl+T - Promijeni temu
+            (True, "t"): ThemeManager.toggle,
+            # F5 - Refresh (generiraj nove podatke)
+            (False, "f5"): self._generate_and_display,
+        }
 
         # Ctrl+1 do Ctrl+6 - Brzi odabir grafa
         for i in range(6):
-            self.bind(f"<Control-Key-{i+1}>", lambda e, idx=i: self._select_graph(idx))
+            self._shortcut_map[(True, str(i + 1))] = (
+                lambda idx=i: self._select_graph(idx)
+            )
+
+        # Jedan binding za sve prečace umjesto zasebnog za svaku tipku
+        self.bind("<KeyPress>", self._dispatch_shortcut)
+
+    def _dispatch_shortcut(self, event):
+        """Poziva handler prečaca za pritisnutu tipku."""
+        handler = self._shortcut_map.get(
+            (bool(event.state & CONTROL_MASK), event.keysym.lower())
+        )
+        if handler is not None:
+            handler()
 
     def _select_graph(self, index: int):
         """Odabire graf po indeksu."""
-        graphs = GraphManager.get_available_graphs()
-        if 0 <= index < len(graphs):
-            self.current_graph.set(graphs[index])
-            self._display_graph()
+        if 0 <= index < len(self._available_graphs):
+            self.current_graph.set(self._available_graphs[index])
+            self._request_graph_draw()
 
     def _update_status_bar(self):
         """Ažurira status bar s informacijama o podacima."""
@@ -740,8 +1090,26 @@ class Application(tk.Tk):
     def destroy(self):
         """Čisti resurse pri zatvaranju."""
         ThemeManager.remove_listener(self._on_theme_change)
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+        if self._pending_graph_draw:
+            self.after_cancel(self._pending_graph_draw)
+
+        # Nespremljene postavke zapisuju se odmah. Spremanje koje worker još
+        # nije pokrenuo preuzima se ovdje; ono koje je u tijeku se pričeka.
+        unsaved = False
+        if self._settings_save_pending:
+            self.after_cancel(self._settings_save_pending)
+            unsaved = True
+        future = self._settings_future
+        if future is not None:
+            if future.cancel():
+                unsaved = True
+            else:
+                wait([future])
 
-        if self.current_fig is not None:
-            plt.close(self.current_fig)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if unsaved:
+            self.settings.save()
 
         super().destroy()
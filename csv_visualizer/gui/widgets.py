@@ -1,15 +1,53 @@
 """Custom widgeti s podrškom za teme."""
 
 import tkinter as tk
-from tkinter import ttk
-from typing import Callable
+from tkinter import font as tkfont, ttk
+from functools import cache
+from typing import Callable, ClassVar
 import platform
 
+import numpy as np
+import pandas as pd
+
 from ..config import Theme, ThemeManager
 
 
+# Trake distribucije ocjena: jedan blok za svakih 5%
+_BARS = tuple("█" * blocks for blocks in range(21))
+
+# Predlošci teksta StatsPanela
+_RULE = "━" * 32
+_STATS_HEAD = "\n".join([
+    _RULE,
+    "  UKUPNA STATISTIKA",
+    _RULE,
+    "  Broj studenata:    {count}",
+    "  Prosječna ocjena:  {avg_grade:.2f}",
+    "  Prosječni bodovi:  {avg_score:.2f}",
+    "  Std. dev. bodova:  {std_score:.2f}",
+    "  Min/Max bodovi:    {min_score} / {max_score}",
+    "  Medijan bodova:    {median_score:.1f}",
+    "",
+    "  Prolaznost:        {pass_rate:.1f}%",
+    "  Položilo:          {passed_count} / {count}",
+    "",
+    _RULE,
+    "  DISTRIBUCIJA OCJENA",
+    _RULE,
+])
+_TERMS_HEAD = "\n".join(["", _RULE, "  PO TERMINIMA", _RULE])
+_GRADE_LINE = "  Ocjena {}: {:3d} ({:5.1f}%) {}".format
+_TERM_LINE = "  {}: {:3d} stud., prosjek {:.1f}".format
+
+
+@cache
 def get_mono_font() -> str:
-    """Vraća dostupan monospace font za sustav."""
+    """
+    Vraća dostupan monospace font za sustav.
+
+    Popis fontova daje Tk, pa se funkcija smije pozvati tek nakon
+    kreiranja glavnog prozora; rezultat se pamti.
+    """
     system = platform.system()
     if system == "Windows":
         # Probaj moderne fontove prvo
@@ -19,11 +57,12 @@ def get_mono_font() -> str:
     else:  # Linux
         preferred = ["JetBrains Mono", "Ubuntu Mono", "DejaVu Sans Mono", "Monospace"]
 
-    # Vrati prvi dostupan ili fallback
-    return preferred[0] if preferred else "TkFixedFont"
-
-
-MONO_FONT = get_mono_font()
+    # Vrati prvi dostupan ili fallback koji Tk uvijek ima
+    available = set(tkfont.families())
+    for family in preferred:
+        if family in available:
+            return family
+    return "Courier"
 
 
 class Tooltip:
@@ -33,7 +72,12 @@ class Tooltip:
         self.widget = widget
         self.text = text
         self.delay = delay
+        # Prozor se kreira jednom i zatim samo skriva/prikazuje
         self.tooltip_window: tk.Toplevel | None = None
+        self._frame: tk.Frame | None = None
+        self._label: tk.Label | None = None
+        self._theme_name: str | None = None
+        self._visible = False
         self._after_id: str | None = None
 
         self.widget.bind("<Enter>", self._schedule_show)
@@ -51,68 +95,119 @@ class Tooltip:
             self.widget.after_cancel(self._after_id)
             self._after_id = None
 
-    def _show(self):
-        """Prikazuje tooltip."""
-        if self.tooltip_window:
+    def _ensure_widgets(self):
+        """Kreira skriveni prozor tooltipa pri prvom prikazu."""
+        if self.tooltip_window is not None:
             return
 
-        theme = ThemeManager.get_current()
-
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-
+        # Prozor je dijete widgeta, pa se uništava zajedno s njim
         self.tooltip_window = tk.Toplevel(self.widget)
+        self.tooltip_window.withdraw()
         self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
 
         # Stil tooltipa
-        frame = tk.Frame(
-            self.tooltip_window,
-            bg=theme.bg_tertiary,
-            highlightbackground=theme.border,
-            highlightthickness=1
-        )
-        frame.pack()
+        self._frame = tk.Frame(self.tooltip_window, highlightthickness=1)
+        self._frame.pack()
 
-        label = tk.Label(
-            frame,
+        self._label = tk.Label(
+            self._frame,
             text=self.text,
-            bg=theme.bg_tertiary,
-            fg=theme.fg_primary,
             font=("Segoe UI", 9),
             padx=8,
             pady=4
         )
-        label.pack()
+        self._label.pack()
+
+    def _apply_theme(self):
+        """Postavlja boje tooltipa ako se tema promijenila od zadnjeg prikaza."""
+        theme = ThemeManager.get_current()
+        if theme.name == self._theme_name:
+            return
+
+        self._frame.configure(bg=theme.bg_tertiary, highlightbackground=theme.border)
+        self._label.configure(bg=theme.bg_tertiary, fg=theme.fg_primary)
+        self._theme_name = theme.name
+
+    def _show(self):
+        """Prikazuje tooltip."""
+        self._after_id = None
+        if self._visible:
+            return
+
+        self._ensure_widgets()
+        self._apply_theme()
+
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+
+        self._label.configure(text=self.text)
+        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        self.tooltip_window.deiconify()
+        self._visible = True
 
     def _hide(self, event=None):
         """Skriva tooltip."""
         self._cancel_scheduled()
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        if self._visible:
+            self.tooltip_window.withdraw()
+            self._visible = False
 
     def update_text(self, new_text: str):
         """Ažurira tekst tooltipa."""
         self.text = new_text
+        if self._visible:
+            self._label.configure(text=new_text)
 
 
-class ThemedFrame(ttk.Frame):
-    """Frame s podrškom za teme."""
+class ThemedMixin:
+    """
+    Mixin za widgete koji prate promjenu teme.
 
-    def __init__(self, master, **kwargs):
-        super().__init__(master, **kwargs)
-        ThemeManager.add_listener(self._on_theme_change)
+    Obavijest o temi samo zakazuje primjenu za idle fazu Tk petlje, pa se
+    više promjena unutar istog ciklusa (npr. brzo dvostruko prebacivanje)
+    primjenjuje jednom, s posljednjom temom. Podklase postavljaju
+    self._theme prije registracije listenera i implementiraju
+    _apply_theme_change.
+    """
+
+    _theme: Theme
+    _pending_theme: Theme | None = None
+    _theme_after_id: str | None = None
 
     def _on_theme_change(self, theme: Theme):
+        self._pending_theme = theme
+        if self._theme_after_id is None:
+            self._theme_after_id = self.after_idle(self._do_apply_theme)
+
+    def _do_apply_theme(self):
+        self._theme_after_id = None
+        theme, self._pending_theme = self._pending_theme, None
+        if theme is None or theme.name == self._theme.name:
+            return
+        self._theme = theme
+        self._apply_theme_change(theme)
+
+    def _apply_theme_change(self, theme: Theme):
         pass  # Override u podklasama
 
     def destroy(self):
         ThemeManager.remove_listener(self._on_theme_change)
+        if self._theme_after_id is not None:
+            self.after_cancel(self._theme_after_id)
+            self._theme_after_id = None
         super().destroy()
 
 
-class ModernButton(tk.Button):
+class ThemedFrame(ThemedMixin, ttk.Frame):
+    """Frame s podrškom za teme."""
+
+    def __init__(self, master, **kwargs):
+        self._theme = ThemeManager.get_current()
+        super().__init__(master, **kwargs)
+        ThemeManager.add_listener(self._on_theme_change)
+
+
+class ModernButton(ThemedMixin, tk.Button):
     """Moderan gumb s hover efektima."""
 
     def __init__(
@@ -138,48 +233,54 @@ class ModernButton(tk.Button):
             **kwargs
         )
 
+        # (tema, primary) za koje su opcije izgrađene
+        self._opts_key: tuple[str, bool] | None = None
         self._apply_theme()
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
         ThemeManager.add_listener(self._on_theme_change)
 
-    def _apply_theme(self):
+    def _build_opts(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Vraća opcije za normalno i hover stanje prema trenutnoj temi."""
         theme = self._theme
         if self.primary:
-            self.configure(
-                bg=theme.btn_primary_bg,
-                fg=theme.btn_primary_fg,
-                activebackground=theme.accent_hover,
-                activeforeground=theme.btn_primary_fg,
-            )
+            normal = {
+                "bg": theme.btn_primary_bg,
+                "fg": theme.btn_primary_fg,
+                "activebackground": theme.accent_hover,
+                "activeforeground": theme.btn_primary_fg,
+            }
+            hover = {"bg": theme.accent_hover}
         else:
-            self.configure(
-                bg=theme.btn_secondary_bg,
-                fg=theme.btn_secondary_fg,
-                activebackground=theme.bg_tertiary,
-                activeforeground=theme.fg_primary,
-            )
+            normal = {
+                "bg": theme.btn_secondary_bg,
+                "fg": theme.btn_secondary_fg,
+                "activebackground": theme.bg_tertiary,
+                "activeforeground": theme.fg_primary,
+            }
+            hover = {"bg": theme.bg_tertiary}
+        return normal, hover
+
+    def _apply_theme(self):
+        # Opcije se grade samo kad se promijeni tema ili vrsta gumba
+        # (app mijenja self.primary pa poziva _apply_theme)
+        key = (self._theme.name, self.primary)
+        if key != self._opts_key:
+            self._normal_opts, self._hover_opts = self._build_opts()
+            self._opts_key = key
+        self.configure(**self._normal_opts)
 
     def _on_enter(self, event):
-        theme = self._theme
-        if self.primary:
-            self.configure(bg=theme.accent_hover)
-        else:
-            self.configure(bg=theme.bg_tertiary)
+        self.configure(**self._hover_opts)
 
     def _on_leave(self, event):
-        self._apply_theme()
+        self.configure(**self._normal_opts)
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self._apply_theme()
 
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
-
 
-class ThemeToggle(tk.Frame):
+class ThemeToggle(ThemedMixin, tk.Frame):
     """Prekidač za dark/light mode."""
 
     def __init__(self, master, **kwargs):
@@ -192,39 +293,50 @@ class ThemeToggle(tk.Frame):
     def _create_widgets(self):
         theme = self._theme
 
+        # Zadnje postavljene opcije labele - mijenjaju se samo razlike
+        self._label_opts = {
+            "text": self._icon_for(theme),
+            "bg": theme.bg_secondary,
+        }
         self.label = tk.Label(
             self,
-            text="☀️" if theme.name == "light" else "🌙",
             font=("Segoe UI", 14),
-            bg=theme.bg_secondary,
-            cursor="hand2"
+            cursor="hand2",
+            **self._label_opts
         )
         self.label.pack(padx=5)
         self.label.bind("<Button-1>", self._toggle)
 
+    @staticmethod
+    def _icon_for(theme: Theme) -> str:
+        return "☀️" if theme.name == "light" else "🌙"
+
     def _toggle(self, event=None):
         ThemeManager.toggle()
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_secondary)
-        self.label.configure(
-            text="☀️" if theme.name == "light" else "🌙",
-            bg=theme.bg_secondary
-        )
 
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
+        wanted = {"text": self._icon_for(theme), "bg": theme.bg_secondary}
+        changed = {
+            option: value for option, value in wanted.items()
+            if self._label_opts[option] != value
+        }
+        if changed:
+            self.label.configure(**changed)
+            self._label_opts = wanted
 
 
-class StatsPanel(tk.Frame):
+class StatsPanel(ThemedMixin, tk.Frame):
     """Panel za prikaz statistike."""
 
     def __init__(self, master, **kwargs):
         self._theme = ThemeManager.get_current()
         super().__init__(master, bg=self._theme.stats_bg, **kwargs)
 
+        # Zadnji prikazani tekst - nepromijenjena statistika se ne iscrtava
+        self._last_text: str | None = None
+
         self._create_widgets()
         ThemeManager.add_listener(self._on_theme_change)
 
@@ -234,7 +346,7 @@ class StatsPanel(tk.Frame):
         self.text = tk.Text(
             self,
             wrap=tk.WORD,
-            font=(MONO_FONT, 10),
+            font=(get_mono_font(), 10),
             bg=theme.stats_bg,
             fg=theme.stats_fg,
             relief="flat",
@@ -248,68 +360,60 @@ class StatsPanel(tk.Frame):
 
     def update_stats(self, stats: dict):
         """Ažurira prikaz statistike."""
-        self.text.config(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
-
-        lines = []
-        lines.append("━" * 32)
-        lines.append("  UKUPNA STATISTIKA")
-        lines.append("━" * 32)
-        lines.append(f"  Broj studenata:    {stats['count']}")
-        lines.append(f"  Prosječna ocjena:  {stats['avg_grade']:.2f}")
-        lines.append(f"  Prosječni bodovi:  {stats['avg_score']:.2f}")
-        lines.append(f"  Std. dev. bodova:  {stats['std_score']:.2f}")
-        lines.append(f"  Min/Max bodovi:    {stats['min_score']} / {stats['max_score']}")
-        lines.append(f"  Medijan bodova:    {stats['median_score']:.1f}")
-        lines.append("")
-        lines.append(f"  Prolaznost:        {stats['pass_rate']:.1f}%")
-        lines.append(f"  Položilo:          {stats['passed_count']} / {stats['count']}")
-
-        lines.append("")
-        lines.append("━" * 32)
-        lines.append("  DISTRIBUCIJA OCJENA")
-        lines.append("━" * 32)
+        lines = [_STATS_HEAD.format_map(stats)]
 
         total = stats["count"]
-        for grade in [1, 2, 3, 4, 5]:
-            count = stats["grade_distribution"].get(grade, 0)
+        grade_distribution = stats["grade_distribution"]
+        for grade in (1, 2, 3, 4, 5):
+            count = grade_distribution.get(grade, 0)
             pct = (count / total) * 100 if total > 0 else 0
-            bar = "█" * int(pct / 5)
-            lines.append(f"  Ocjena {grade}: {count:3d} ({pct:5.1f}%) {bar}")
-
-        lines.append("")
-        lines.append("━" * 32)
-        lines.append("  PO TERMINIMA")
-        lines.append("━" * 32)
-
-        for term, term_stats in stats["term_stats"].items():
-            lines.append(
-                f"  {term}: {term_stats['count']:3d} stud., "
-                f"prosjek {term_stats['avg_score']:.1f}"
-            )
+            lines.append(_GRADE_LINE(grade, count, pct, _BARS[int(pct / 5)]))
 
-        self.text.insert(tk.END, "\n".join(lines))
-        self.text.config(state=tk.DISABLED)
+        lines.append(_TERMS_HEAD)
+        lines.extend(
+            _TERM_LINE(term, term_stats["count"], term_stats["avg_score"])
+            for term, term_stats in stats["term_stats"].items()
+        )
+
+        self._set_text("\n".join(lines))
 
     def clear(self):
         """Briše sadržaj."""
+        self._set_text("  Nema učitanih podataka.")
+
+    def _set_text(self, text: str):
+        """Postavlja tekst panela; isti tekst se ne iscrtava ponovno."""
+        if text == self._last_text:
+            return
+
         self.text.config(state=tk.NORMAL)
-        self.text.delete(1.0, tk.END)
-        self.text.insert(tk.END, "  Nema učitanih podataka.")
+        self.text.replace("1.0", tk.END, text)
         self.text.config(state=tk.DISABLED)
+        self._last_text = text
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.stats_bg)
         self.text.configure(bg=theme.stats_bg, fg=theme.stats_fg)
 
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
 
+class DataTable(ThemedMixin, tk.Frame):
+    """
+    Tablica za prikaz podataka s sortiranjem.
+
+    Tablica je virtualizirana: u Treeview se upisuju samo redovi koji stanu
+    u vidljivi dio, a scrollbar se pomiče po cijelom DataFrameu.
+    """
+
+    # Visina reda u pikselima (rowheight stila)
+    ROW_HEIGHT = 28
+    # Redovi pomaknuti jednim okretajem kotačića miša
+    WHEEL_ROWS = 3
+    # Stupci DataFramea redom kojim se prikazuju
+    DF_COLUMNS = ("student_id", "ime", "prezime", "termin", "bodovi", "ocjena")
 
-class DataTable(tk.Frame):
-    """Tablica za prikaz podataka s sortiranjem."""
+    # ttk stilovi su zajednički cijelom procesu - tema koja je zadnja primijenjena
+    # na "DataTable.Treeview", pa ga svaka instanca ne mora ponovno konfigurirati
+    _styled_theme: ClassVar[str | None] = None
 
     def __init__(self, master, **kwargs):
         self._theme = ThemeManager.get_current()
@@ -318,6 +422,18 @@ class DataTable(tk.Frame):
         self._sort_column = None
         self._sort_reverse = False
         self._data = None
+        # Stupac po kojem je self._data sortiran (None za izvorni redoslijed)
+        self._data_sorted_by: str | None = None
+
+        # Virtualizacija: indeks prvog prikazanog reda, broj redova koji
+        # stanu u prikaz, itemi Treeviewa koji se ponovno koriste
+        self._first_row = 0
+        self._visible_rows = 1
+        self._items: list[str] = []
+        self._selected_row: int | None = None
+
+        # Jedan Style objekt za inicijalno postavljanje i promjene teme
+        self._style = ttk.Style()
 
         self._create_widgets()
         ThemeManager.add_listener(self._on_theme_change)
@@ -328,13 +444,13 @@ class DataTable(tk.Frame):
         # Treeview s scrollbarom
         columns = ("id", "ime", "prezime", "termin", "bodovi", "ocjena")
 
-        style = ttk.Style()
+        style = self._style
         style.configure(
             "DataTable.Treeview",
             background=theme.bg_secondary,
             foreground=theme.fg_primary,
             fieldbackground=theme.bg_secondary,
-            rowheight=28,
+            rowheight=self.ROW_HEIGHT,
             font=("Segoe UI", 10)
         )
         style.configure(
@@ -348,6 +464,7 @@ class DataTable(tk.Frame):
             background=[("selected", theme.accent)],
             foreground=[("selected", theme.btn_primary_fg)]
         )
+        DataTable._styled_theme = theme.name
 
         # Container za treeview i scrollbar - sačuvaj referencu
         self._container = tk.Frame(self, bg=theme.bg_secondary)
@@ -361,11 +478,17 @@ class DataTable(tk.Frame):
             selectmode="browse"
         )
 
-        # Vertikalni scrollbar
+        # Vertikalni scrollbar - pomiče prozor redova, ne sam Treeview
         self._v_scrollbar = ttk.Scrollbar(
-            self._container, orient=tk.VERTICAL, command=self.tree.yview
+            self._container, orient=tk.VERTICAL, command=self._on_yview
         )
-        self.tree.configure(yscrollcommand=self._v_scrollbar.set)
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self._move_selection(1))
 
         # Horizontalni scrollbar
         self._h_scrollbar = ttk.Scrollbar(
@@ -400,24 +523,106 @@ class DataTable(tk.Frame):
         self._container.grid_columnconfigure(0, weight=1)
 
     def load_data(self, df):
-        """Učitava podatke u tablicu."""
+        """Postavlja podatke tablice; iscrtavaju se samo vidljivi redovi."""
         self._data = df
-
-        # Očisti postojeće
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Dodaj redove
-        for _, row in df.iterrows():
-            values = (
-                row["student_id"],
-                row["ime"],
-                row["prezime"],
-                row["termin"],
-                row["bodovi"],
-                row["ocjena"]
+        self._data_sorted_by = None
+        self._first_row = 0
+        self._selected_row = None
+        self._render()
+
+    def _render(self):
+        """Upisuje vidljivi prozor redova u Treeview i ažurira scrollbar."""
+        total = 0 if self._data is None else len(self._data)
+        self._first_row = max(0, min(self._first_row, total - self._visible_rows))
+
+        # Jedan red više popunjava djelomično vidljiv red na dnu
+        stop = min(total, self._first_row + self._visible_rows + 1)
+        rows = []
+        if stop > self._first_row:
+            window = self._data.iloc[self._first_row:stop]
+            rows = list(zip(*(window[col].tolist() for col in self.DF_COLUMNS)))
+
+        # Postojeći itemi se ponovno koriste, višak se briše
+        for item, values in zip(self._items, rows):
+            self.tree.item(item, values=values)
+        for values in rows[len(self._items):]:
+            self._items.append(self.tree.insert("", tk.END, values=values))
+        if len(self._items) > len(rows):
+            self.tree.delete(*self._items[len(rows):])
+            del self._items[len(rows):]
+
+        # Odabir prati red podataka, ne poziciju na ekranu
+        index = None if self._selected_row is None else self._selected_row - self._first_row
+        if index is not None and 0 <= index < len(self._items):
+            self.tree.selection_set(self._items[index])
+        elif self.tree.selection():
+            self.tree.selection_remove(self.tree.selection())
+        # Treeview sam ne smije skrolati - prozor uvijek počinje od vrha
+        self.tree.yview_moveto(0)
+
+        if total:
+            self._v_scrollbar.set(
+                self._first_row / total,
+                min(1.0, (self._first_row + self._visible_rows) / total)
             )
-            self.tree.insert("", tk.END, values=values)
+        else:
+            self._v_scrollbar.set(0.0, 1.0)
+
+    def _scroll_to(self, first_row: int):
+        """Pomiče prikaz tako da počinje od zadanog reda."""
+        if first_row != self._first_row:
+            self._first_row = first_row
+            self._render()
+
+    def _on_yview(self, *args):
+        """Handler scrollbara (moveto/scroll)."""
+        if self._data is None:
+            return
+
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._data)))
+        elif args[0] == "scroll":
+            step = self._visible_rows if args[2] == "pages" else 1
+            self._scroll_to(self._first_row + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        """Pomiče prikaz kotačićem miša."""
+        if event.num == 4 or event.delta > 0:
+            direction = -1
+        else:
+            direction = 1
+        self._scroll_to(self._first_row + direction * self.WHEEL_ROWS)
+        return "break"
+
+    def _on_resize(self, event):
+        """Preračunava broj vidljivih redova pri promjeni veličine."""
+        # Zaglavlje zauzima otprilike jedan red
+        visible_rows = max(1, event.height // self.ROW_HEIGHT - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render()
+
+    def _move_selection(self, step: int):
+        """Pomiče odabir tipkovnicom i po potrebi skrola prikaz."""
+        if self._data is None or len(self._data) == 0:
+            return "break"
+
+        current = self._first_row - 1 if self._selected_row is None else self._selected_row
+        row = max(0, min(len(self._data) - 1, current + step))
+        self._selected_row = row
+
+        if row < self._first_row:
+            self._first_row = row
+        elif row >= self._first_row + self._visible_rows:
+            self._first_row = row - self._visible_rows + 1
+        self._render()
+        return "break"
+
+    def _on_select(self, event):
+        """Pamti odabrani red podataka."""
+        selection = self.tree.selection()
+        if selection and selection[0] in self._items:
+            self._selected_row = self._first_row + self._items.index(selection[0])
 
     def _sort_by(self, column: str):
         """Sortira tablicu po stupcu."""
@@ -440,25 +645,48 @@ class DataTable(tk.Frame):
             "ocjena": "ocjena"
         }
 
-        sorted_df = self._data.sort_values(
-            by=col_map[column],
-            ascending=not self._sort_reverse
-        )
+        if self._data_sorted_by == column:
+            # Podaci su već sortirani po ovom stupcu - dovoljno je obrnuti redoslijed
+            sorted_df = self._data.iloc[::-1]
+        else:
+            order = self._sort_order(self._data[col_map[column]])
+            if self._sort_reverse:
+                order = order[::-1]
+            sorted_df = self._data.iloc[order]
 
         self.load_data(sorted_df)
+        self._data_sorted_by = column
+
+    @staticmethod
+    def _sort_order(values: pd.Series) -> np.ndarray:
+        """Vraća stabilni redoslijed sortiranja stupca."""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Kategorije su sortirane, pa je redoslijed kodova abecedni;
+            # NumPy cjelobrojne kodove sortira radix sortom
+            keys = values.cat.codes.to_numpy()
+        elif pd.api.types.is_numeric_dtype(values.dtype):
+            keys = values.to_numpy()
+        else:
+            # Tekstualni stupci (object) - pandas usporedba stringova
+            return values.argsort(kind="stable").to_numpy()
+        return np.argsort(keys, kind="stable")
 
     def clear(self):
         """Briše tablicu."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         self._data = None
+        self._first_row = 0
+        self._selected_row = None
+        self._render()
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_secondary)
         self._container.configure(bg=theme.bg_secondary)
 
-        style = ttk.Style()
+        if DataTable._styled_theme == theme.name:
+            return
+        DataTable._styled_theme = theme.name
+
+        style = self._style
         style.configure(
             "DataTable.Treeview",
             background=theme.bg_secondary,
@@ -476,12 +704,8 @@ class DataTable(tk.Frame):
             foreground=[("selected", theme.btn_primary_fg)]
         )
 
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
 
-
-class FilterPanel(tk.Frame):
+class FilterPanel(ThemedMixin, tk.Frame):
     """Panel za filtriranje podataka po terminu i ocjeni."""
 
     def __init__(
@@ -495,6 +719,9 @@ class FilterPanel(tk.Frame):
 
         self._on_filter = on_filter
         self._terms: list[str] = []
+        self._term_values: list[str] = ["Svi"]
+        # Zadnji proslijeđeni (termin, ocjena) - ponovni odabir iste vrijednosti se ignorira
+        self._last_state: tuple[str | None, int | None] = (None, None)
         self._create_widgets()
         ThemeManager.add_listener(self._on_theme_change)
 
@@ -569,9 +796,15 @@ class FilterPanel(tk.Frame):
         self._grade_label = grade_label
 
     def update_terms(self, terms: list[str]):
-        """Ažurira dostupne termine."""
+        """Ažurira dostupne termine; isti popis ne mijenja Combobox."""
+        if terms == self._terms:
+            return
         self._terms = terms
-        self.term_combo["values"] = ["Svi"] + sorted(terms)
+
+        values = ["Svi", *sorted(terms)]
+        if values != self._term_values:
+            self._term_values = values
+            self.term_combo["values"] = values
 
     def _on_change(self, event=None):
         term = self.term_var.get()
@@ -580,15 +813,25 @@ class FilterPanel(tk.Frame):
         term_filter = None if term == "Svi" else term
         grade_filter = None if grade == "Sve" else int(grade)
 
+        state = (term_filter, grade_filter)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self._on_filter(term_filter, grade_filter)
 
     def _reset(self, event=None):
+        if self._last_state == (None, None):
+            return
+        self.reset_selection()
+        self._on_filter(None, None)
+
+    def reset_selection(self):
+        """Vraća odabir na sve termine i ocjene bez pozivanja on_filter."""
         self.term_var.set("Svi")
         self.grade_var.set("Sve")
-        self._on_filter(None, None)
+        self._last_state = (None, None)
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_secondary)
         self._term_frame.configure(bg=theme.bg_secondary)
         self._grade_frame.configure(bg=theme.bg_secondary)
@@ -596,19 +839,19 @@ class FilterPanel(tk.Frame):
         self._grade_label.configure(bg=theme.bg_secondary, fg=theme.fg_primary)
         self.reset_btn.configure(bg=theme.bg_secondary, fg=theme.accent)
 
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
-
 
-class SearchBar(tk.Frame):
+class SearchBar(ThemedMixin, tk.Frame):
     """Traka za pretraživanje."""
 
+    # Pauza u tipkanju (ms) nakon koje se pokreće pretraga
+    SEARCH_DELAY_MS = 200
+
     def __init__(self, master, on_search: Callable[[str], None], **kwargs):
         self._theme = ThemeManager.get_current()
         super().__init__(master, bg=self._theme.bg_secondary, **kwargs)
 
         self._on_search = on_search
+        self._search_after_id: str | None = None
         self._create_widgets()
         ThemeManager.add_listener(self._on_theme_change)
 
@@ -638,7 +881,7 @@ class SearchBar(tk.Frame):
         )
         self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=8)
         self.entry.bind("<KeyRelease>", self._on_key)
-        self.entry.bind("<Return>", self._on_key)
+        self.entry.bind("<Return>", self._on_return)
 
         # Placeholder
         self.entry.insert(0, "Pretraži po imenu...")
@@ -659,9 +902,29 @@ class SearchBar(tk.Frame):
         self.clear_btn.bind("<Button-1>", self._clear)
 
     def _on_key(self, event):
+        """Odgađa pretragu dok korisnik tipka."""
+        query = self.entry.get()
+        if query == "Pretraži po imenu...":
+            return
+
+        self._cancel_pending()
+        self._search_after_id = self.after(self.SEARCH_DELAY_MS, self._fire_search, query)
+
+    def _on_return(self, event):
+        """Enter pokreće pretragu odmah."""
         query = self.entry.get()
         if query != "Pretraži po imenu...":
-            self._on_search(query)
+            self._cancel_pending()
+            self._fire_search(query)
+
+    def _fire_search(self, query: str):
+        self._search_after_id = None
+        self._on_search(query)
+
+    def _cancel_pending(self):
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
 
     def _on_focus_in(self, event):
         if self.entry.get() == "Pretraži po imenu...":
@@ -674,12 +937,12 @@ class SearchBar(tk.Frame):
             self.entry.configure(fg=self._theme.fg_muted)
 
     def _clear(self, event=None):
+        self._cancel_pending()
         self.entry.delete(0, tk.END)
         self._on_search("")
         self._on_focus_out(None)
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_secondary)
         self.icon_label.configure(bg=theme.bg_secondary)
 
@@ -695,11 +958,11 @@ class SearchBar(tk.Frame):
         self.clear_btn.configure(bg=theme.bg_secondary, fg=theme.fg_muted)
 
     def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
+        self._cancel_pending()
         super().destroy()
 
 
-class StatusBar(tk.Frame):
+class StatusBar(ThemedMixin, tk.Frame):
     """Status bar na dnu aplikacije."""
 
     def __init__(self, master, **kwargs):
@@ -768,19 +1031,14 @@ class StatusBar(tk.Frame):
         """Postavlja info tekst na desnoj strani."""
         self.info_label.configure(text=text)
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_secondary)
         self.status_label.configure(bg=theme.bg_secondary)
         self.info_label.configure(bg=theme.bg_secondary, fg=theme.fg_muted)
         self.separator.configure(bg=theme.border)
 
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
-
 
-class LoadingIndicator(tk.Frame):
+class LoadingIndicator(ThemedMixin, tk.Frame):
     """Animirani loading indikator."""
 
     FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
@@ -846,19 +1104,17 @@ class LoadingIndicator(tk.Frame):
         self._text = text
         self.text_label.configure(text=text)
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_primary)
         self.spinner_label.configure(bg=theme.bg_primary, fg=theme.accent)
         self.text_label.configure(bg=theme.bg_primary, fg=theme.fg_primary)
 
     def destroy(self):
         self.stop()
-        ThemeManager.remove_listener(self._on_theme_change)
         super().destroy()
 
 
-class EmptyState(tk.Frame):
+class EmptyState(ThemedMixin, tk.Frame):
     """Prikaz kad nema podataka."""
 
     def __init__(
@@ -917,14 +1173,9 @@ class EmptyState(tk.Frame):
 
         self._center = center
 
-    def _on_theme_change(self, theme: Theme):
-        self._theme = theme
+    def _apply_theme_change(self, theme: Theme):
         self.configure(bg=theme.bg_primary)
         self._center.configure(bg=theme.bg_primary)
         self.icon_label.configure(bg=theme.bg_primary)
         self.title_label.configure(bg=theme.bg_primary, fg=theme.fg_primary)
         self.message_label.configure(bg=theme.bg_primary, fg=theme.fg_muted)
-
-    def destroy(self):
-        ThemeManager.remove_listener(self._on_theme_change)
-        super().destroy()
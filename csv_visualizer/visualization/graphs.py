@@ -1,10 +1,20 @@
 """Generiranje grafova s podrškom za teme."""
 
+import weakref
+from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
-import matplotlib.pyplot as plt
+from functools import lru_cache
+from typing import Any, Callable, ClassVar
+from matplotlib import rc_context
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import Collection
+from matplotlib.colors import to_hex, to_rgba
 from matplotlib.figure import Figure
-import pandas as pd
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.text import Text
+import numpy as np
 
 from ..config import ThemeManager, Theme
 from ..data import ExamData
@@ -20,9 +30,72 @@ class GraphType(Enum):
     BOX_PLOT_BY_TERM = "Box plot bodova po terminu"
 
 
+@dataclass(frozen=True, slots=True)
+class GraphStyle:
+    """Boje grafova izvedene iz teme, računaju se jednom po temi."""
+
+    # Boje ocjena 1-5
+    grade_colors: tuple[str, ...]
+    # Boje pie charta po broju isječaka (indeks = broj prisutnih ocjena)
+    pie_colors: tuple[tuple[str, ...], ...]
+    # Boje raspona bodova: pad, dovoljan, dobar, vrlo dobar, izvrstan
+    score_band_colors: tuple[str, str, str, str, str]
+    # rcParams osi i tickova - nove osi ih dobivaju pri kreiranju (rc_context)
+    rc_params: tuple[tuple[str, Any], ...]
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def for_theme(theme: Theme) -> "GraphStyle":
+        """Vraća stil za temu (memoizirano - Theme je nepromjenjiv i hashabilan)."""
+        colors = theme.graph_colors
+        grade_colors = tuple(colors[:5])
+        return GraphStyle(
+            grade_colors=grade_colors,
+            pie_colors=tuple(grade_colors[:k] for k in range(6)),
+            score_band_colors=(
+                theme.error,
+                theme.warning,
+                colors[0],
+                theme.success,
+                colors[4] if len(colors) > 4 else theme.info,
+            ),
+            rc_params=(
+                ("axes.facecolor", theme.graph_bg),
+                ("axes.edgecolor", theme.graph_grid),
+                ("axes.labelcolor", theme.graph_fg),
+                ("axes.spines.top", False),
+                ("axes.spines.right", False),
+                ("xtick.color", theme.graph_fg),
+                ("xtick.labelcolor", theme.graph_fg),
+                ("ytick.color", theme.graph_fg),
+                ("ytick.labelcolor", theme.graph_fg),
+            ),
+        )
+
+
 class GraphManager:
     """Upravlja generiranjem grafova s podrškom za teme."""
 
+    # Nazivi grafova redom definicije - lista je nepromjenjiva, računa se jednom
+    _AVAILABLE_GRAPHS: ClassVar[tuple[str, ...]] = tuple(gt.value for gt in GraphType)
+
+    # Donje granice bodova za boje histograma (dovoljan, dobar, vrlo dobar, izvrstan)
+    SCORE_BAND_LIMITS: ClassVar[tuple[int, ...]] = (50, 65, 80, 90)
+
+    # Atribut figure s nacrtanim grafom: (tip grafa, artisti potrebni za ažuriranje).
+    # Čuva se na samoj figuri - u WeakKeyDictionary bi artisti (vrijednost)
+    # preko .figure držali figuru (ključ) živom zauvijek
+    _RENDERED_ATTR: ClassVar[str] = "_graph_manager_rendered"
+
+    # Sve ocjene i njihove oznake na grafovima - ne grade se pri svakom crtanju
+    GRADES: ClassVar[tuple[int, ...]] = (1, 2, 3, 4, 5)
+    _GRADE_TICK_LABELS: ClassVar[tuple[str, ...]] = tuple(str(g) for g in GRADES)
+    _GRADE_PIE_LABELS: ClassVar[dict[int, str]] = {g: f"Ocjena {g}" for g in GRADES}
+    # Razmak isječaka pie charta po broju isječaka
+    _PIE_EXPLODE: ClassVar[tuple[tuple[float, ...], ...]] = tuple(
+        (0.02,) * k for k in range(len(GRADES) + 1)
+    )
+
     def __init__(self):
         self._graph_functions: dict[GraphType, Callable] = {
             GraphType.STUDENTS_BY_GRADE: self._fig_students_by_grade,
@@ -33,34 +106,52 @@ class GraphManager:
             GraphType.BOX_PLOT_BY_TERM: self._fig_boxplot_by_term,
         }
 
+        # Grafovi čiji se podaci mogu zamijeniti bez ponovnog crtanja figure
+        self._update_functions: dict[GraphType, Callable] = {
+            GraphType.STUDENTS_BY_GRADE: self._update_students_by_grade,
+            GraphType.PASS_RATE_BY_TERM: self._update_pass_rate_by_term,
+        }
+
+        # Što figura trenutno prikazuje: (tip grafa, podaci, naziv teme)
+        self._shown: weakref.WeakKeyDictionary[Figure, tuple[GraphType, ExamData, str]] = (
+            weakref.WeakKeyDictionary()
+        )
+
     @property
     def theme(self) -> Theme:
         """Trenutna tema."""
         return ThemeManager.get_current()
 
+    @property
+    def style(self) -> GraphStyle:
+        """Boje grafova za trenutnu temu."""
+        return GraphStyle.for_theme(self.theme)
+
     def _create_figure(
         self,
         figsize: tuple[int, int] = (8, 5),
-        set_ax_bg: bool = True
-    ) -> tuple[Figure, plt.Axes]:
-        """Kreira figuru s temom."""
-        fig, ax = plt.subplots(figsize=figsize)
-
-        theme = self.theme
-        fig.patch.set_facecolor(theme.graph_bg)
-
-        if set_ax_bg:
-            ax.set_facecolor(theme.graph_bg)
-
-        # Stiliziranje osi
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.spines["left"].set_color(theme.graph_grid)
-        ax.spines["bottom"].set_color(theme.graph_grid)
-
-        ax.tick_params(colors=theme.graph_fg, labelcolor=theme.graph_fg)
-        ax.xaxis.label.set_color(theme.graph_fg)
-        ax.yaxis.label.set_color(theme.graph_fg)
+        set_ax_bg: bool = True,
+        fig: Figure | None = None
+    ) -> tuple[Figure, Axes]:
+        """Kreira figuru s temom ili ponovno koristi postojeću."""
+        # Figura se kreira izravno, bez pyplota - ne registrira se u njegovom
+        # globalnom popisu pa je skuplja garbage collector čim nije referencirana
+        if fig is None:
+            fig = Figure(figsize=figsize)
+        else:
+            fig.clear()
+            self._set_rendered(fig, None)
+            self._shown.pop(fig, None)
+        # Boje osi, spineova i tickova dolaze iz rcParams teme umjesto
+        # stiliziranja svake nove osi; rc_context ih vraća nakon kreiranja
+        # pa globalni rcParams ostaju netaknuti
+        with rc_context(dict(self.style.rc_params)):
+            ax = fig.add_subplot()
+
+        fig.patch.set_facecolor(self.theme.graph_bg)
+        if not set_ax_bg:
+            # Os bez vlastite pozadine (npr. pie chart) - vidi se pozadina figure
+            ax.patch.set_visible(False)
 
         return fig, ax
 
@@ -78,32 +169,177 @@ class GraphManager:
         if graph_type not in self._graph_functions:
             raise ValueError(f"Nepoznat tip grafa: {graph_type}")
 
-        return self._graph_functions[graph_type](data.dataframe)
+        return self._graph_functions[graph_type](data)
 
     def get_graph_by_name(self, name: str, data: ExamData) -> Figure:
         """Generira graf po nazivu."""
-        for graph_type in GraphType:
-            if graph_type.value == name:
-                return self.get_graph(graph_type, data)
-        raise ValueError(f"Nepoznat naziv grafa: {name}")
+        return self.get_graph(self._graph_type_by_name(name), data)
+
+    def render_into(self, fig: Figure, name: str, data: ExamData) -> Figure:
+        """
+        Crta graf u postojeću figuru umjesto kreiranja nove.
+
+        Args:
+            fig: Figura koja se briše i ponovno crta
+            name: Naziv grafa
+            data: Podaci za vizualizaciju
+
+        Returns:
+            Ista figura, s novim grafom
+        """
+        graph_type = self._graph_type_by_name(name)
+        self._graph_functions[graph_type](data, fig)
+        self._shown[fig] = (graph_type, data, self.theme.name)
+        return fig
+
+    def update_in_place(self, fig: Figure, name: str, data: ExamData) -> list[Artist] | None:
+        """
+        Zamjenjuje podatke već nacrtanog grafa bez brisanja figure.
+
+        Args:
+            fig: Figura u kojoj je graf nacrtan
+            name: Naziv grafa
+            data: Novi podaci
+
+        Returns:
+            Promijenjeni artisti (za blitting), prazna lista ako se promijenila os
+            pa figuru treba iscrtati cijelu, ili None ako graf treba nacrtati ponovno
+        """
+        graph_type = self._graph_type_by_name(name)
+        rendered = self._get_rendered(fig)
+        if rendered is None or rendered[0] is not graph_type:
+            return None
+
+        update = self._update_functions.get(graph_type)
+        if update is None:
+            return None
+
+        artists = update(data, rendered[1])
+        if artists is not None:
+            self._shown[fig] = (graph_type, data, self.theme.name)
+        return artists
+
+    def is_current(self, fig: Figure, name: str, data: ExamData) -> bool:
+        """Vraća prikazuje li figura već zadani graf za iste podatke i temu."""
+        shown = self._shown.get(fig)
+        return (
+            shown is not None
+            and shown[0] is self._graph_type_by_name(name)
+            and shown[1] is data
+            and shown[2] == self.theme.name
+        )
+
+    def invalidate(self, fig: Figure) -> None:
+        """Zaboravlja nacrtani graf; sljedeći prikaz ga crta ispočetka."""
+        self._set_rendered(fig, None)
+        self._shown.pop(fig, None)
+
+    @classmethod
+    def _get_rendered(cls, fig: Figure) -> tuple[GraphType, Any] | None:
+        """Vraća nacrtani graf figure i stanje za ažuriranje."""
+        return getattr(fig, cls._RENDERED_ATTR, None)
+
+    @classmethod
+    def _set_rendered(cls, fig: Figure, rendered: tuple[GraphType, Any] | None) -> None:
+        """Pamti nacrtani graf figure (None ga briše)."""
+        setattr(fig, cls._RENDERED_ATTR, rendered)
+
+    def retheme(self, fig: Figure, old_theme: Theme) -> bool:
+        """
+        Prebacuje boje nacrtanog grafa iz stare u trenutnu temu bez ponovnog crtanja.
+
+        Args:
+            fig: Figura nacrtana u staroj temi
+            old_theme: Tema u kojoj je figura nacrtana
+
+        Returns:
+            False ako se boje ne mogu jednoznačno zamijeniti (graf treba nacrtati ponovno)
+        """
+        theme = self.theme
+        mapping = self._theme_color_map(old_theme, theme)
+        if mapping is None:
+            return False
+
+        def swap(color):
+            rgba = to_rgba(color)
+            new_color = mapping.get(to_hex(rgba))
+            return color if new_color is None else to_rgba(new_color, rgba[3])
+
+        for artist in fig.findobj():
+            if isinstance(artist, Patch):
+                artist.set_facecolor(swap(artist.get_facecolor()))
+                artist.set_edgecolor(swap(artist.get_edgecolor()))
+            elif isinstance(artist, Line2D):
+                artist.set_color(swap(artist.get_color()))
+                artist.set_markerfacecolor(swap(artist.get_markerfacecolor()))
+                artist.set_markeredgecolor(swap(artist.get_markeredgecolor()))
+            elif isinstance(artist, Text):
+                artist.set_color(swap(artist.get_color()))
+            elif isinstance(artist, Collection):
+                artist.set_facecolor([swap(c) for c in artist.get_facecolor()])
+                artist.set_edgecolor([swap(c) for c in artist.get_edgecolor()])
+
+        # Tickovi koji se tek kreiraju (npr. pri promjeni veličine) uzimaju ove boje
+        for ax in fig.axes:
+            ax.tick_params(colors=theme.graph_fg, labelcolor=theme.graph_fg)
+
+        shown = self._shown.get(fig)
+        if shown is not None:
+            self._shown[fig] = (shown[0], shown[1], theme.name)
+        return True
+
+    @staticmethod
+    def _theme_color_map(old: Theme, new: Theme) -> dict[str, str] | None:
+        """
+        Mapira boje koje grafovi koriste iz stare teme u novu.
+
+        Vraća None ako mapiranje nije jednoznačno.
+        """
+        if len(old.graph_colors) != len(new.graph_colors):
+            return None
+
+        pairs = [
+            (old.graph_bg, new.graph_bg),
+            (old.graph_fg, new.graph_fg),
+            (old.graph_grid, new.graph_grid),
+            (old.success, new.success),
+            (old.warning, new.warning),
+            (old.error, new.error),
+            (old.info, new.info),
+            *zip(old.graph_colors, new.graph_colors),
+        ]
+
+        mapping: dict[str, str] = {}
+        for old_color, new_color in pairs:
+            # Ista boja stare teme ne smije prelaziti u dvije različite boje
+            if mapping.setdefault(to_hex(old_color), new_color) != new_color:
+                return None
+        return mapping
+
+    @staticmethod
+    def _graph_type_by_name(name: str) -> GraphType:
+        """Vraća tip grafa po nazivu."""
+        try:
+            # Enum traži po vrijednosti preko internog rječnika
+            return GraphType(name)
+        except ValueError:
+            raise ValueError(f"Nepoznat naziv grafa: {name}") from None
 
     @classmethod
     def get_available_graphs(cls) -> list[str]:
         """Vraća listu dostupnih grafova."""
-        return [gt.value for gt in GraphType]
+        return list(cls._AVAILABLE_GRAPHS)
 
-    def _fig_students_by_grade(self, df: pd.DataFrame) -> Figure:
+    def _fig_students_by_grade(self, data: ExamData, fig: Figure | None = None) -> Figure:
         """Stupčasti graf broja studenata po ocjeni."""
         theme = self.theme
-        fig, ax = self._create_figure()
+        fig, ax = self._create_figure(fig=fig)
 
-        grade_counts = df["ocjena"].value_counts().sort_index()
-        all_grades = [1, 2, 3, 4, 5]
-        values = [grade_counts.get(g, 0) for g in all_grades]
+        values = data.get_grade_counts().reindex(self.GRADES, fill_value=0).tolist()
 
-        colors = list(theme.graph_colors[:5])
+        colors = list(self.style.grade_colors)
         bars = ax.bar(
-            [str(g) for g in all_grades],
+            self._GRADE_TICK_LABELS,
             values,
             color=colors,
             edgecolor=theme.graph_bg,
@@ -121,38 +357,71 @@ class GraphManager:
         ax.set_ylabel("Broj studenata", fontsize=11)
         ax.set_ylim(bottom=0)
 
-        for bar, v in zip(bars, values):
-            if v > 0:
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2,
-                    v + 0.3,
-                    str(v),
-                    ha="center",
-                    va="bottom",
-                    fontsize=10,
-                    fontweight="bold",
-                    color=theme.graph_fg
-                )
+        # Oznaka postoji za svaki stupac (prazni su skriveni) kako bi ih
+        # ažuriranje moglo samo premjestiti
+        texts = [
+            ax.text(
+                bar.get_x() + bar.get_width() / 2,
+                v + 0.3,
+                str(v),
+                ha="center",
+                va="bottom",
+                fontsize=10,
+                fontweight="bold",
+                color=theme.graph_fg,
+                visible=v > 0
+            )
+            for bar, v in zip(bars, values)
+        ]
 
         fig.tight_layout()
+        self._set_rendered(fig, (GraphType.STUDENTS_BY_GRADE, (list(bars), texts)))
         return fig
 
-    def _fig_grade_share(self, df: pd.DataFrame) -> Figure:
+    def _update_students_by_grade(self, data: ExamData, state) -> list[Artist] | None:
+        """
+        Mijenja visine stupaca i oznake bez ponovnog kreiranja grafa.
+
+        Os Y se ponovno skalira, pa se vraća prazna lista - figura se crta cijela.
+        """
+        bars, texts = state
+        # Os i figura se dohvaćaju preko artista, ne čuvaju se u stanju
+        ax = bars[0].axes
+        fig = ax.figure
+        values = data.get_grade_counts().reindex(self.GRADES, fill_value=0).tolist()
+
+        for bar, text, v in zip(bars, texts, values):
+            bar.set_height(v)
+            text.set_y(v + 0.3)
+            text.set_text(str(v))
+            text.set_visible(v > 0)
+
+        # Ista granica osi kao pri crtanju: autoscale po stupcima, dno na nuli
+        ax.set_autoscaley_on(True)
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+        ax.set_ylim(bottom=0)
+
+        # Širina oznaka osi Y se mogla promijeniti
+        fig.tight_layout()
+        return []
+
+    def _fig_grade_share(self, data: ExamData, fig: Figure | None = None) -> Figure:
         """Pie chart udjela ocjena."""
         theme = self.theme
-        fig, ax = self._create_figure(set_ax_bg=False)
+        fig, ax = self._create_figure(set_ax_bg=False, fig=fig)
 
-        grade_counts = df["ocjena"].value_counts().sort_index()
-        labels = [f"Ocjena {int(g)}" for g in grade_counts.index]
+        grade_counts = data.get_grade_counts()
+        pie_labels = self._GRADE_PIE_LABELS
+        labels = [pie_labels[g] for g in grade_counts.index.tolist()]
 
-        colors = list(theme.graph_colors[:len(labels)])
         wedges, texts, autotexts = ax.pie(
-            grade_counts.values,
+            grade_counts.to_numpy(),
             labels=labels,
             autopct="%.1f%%",
             startangle=90,
-            colors=colors,
-            explode=[0.02] * len(labels),
+            colors=self.style.pie_colors[len(labels)],
+            explode=self._PIE_EXPLODE[len(labels)],
             shadow=False,
             textprops={"color": theme.graph_fg}
         )
@@ -173,44 +442,29 @@ class GraphManager:
         fig.tight_layout()
         return fig
 
-    def _fig_score_histogram(self, df: pd.DataFrame) -> Figure:
+    def _fig_score_histogram(self, data: ExamData, fig: Figure | None = None) -> Figure:
         """Histogram raspodjele bodova."""
         theme = self.theme
-        fig, ax = self._create_figure()
+        fig, ax = self._create_figure(fig=fig)
 
         n, bins, patches = ax.hist(
-            df["bodovi"],
+            data.dataframe["bodovi"],
             bins=10,
             range=(0, 100),
             edgecolor=theme.graph_bg,
             linewidth=1.5
         )
 
-        # Boje prema ocjenama
-        grade_colors = {
-            "fail": theme.error,
-            "pass": theme.warning,
-            "good": theme.graph_colors[0],
-            "very_good": theme.success,
-            "excellent": theme.graph_colors[4] if len(theme.graph_colors) > 4 else theme.info,
-        }
-
-        for i, patch in enumerate(patches):
-            bin_center = (bins[i] + bins[i + 1]) / 2
-            if bin_center < 50:
-                patch.set_facecolor(grade_colors["fail"])
-            elif bin_center < 65:
-                patch.set_facecolor(grade_colors["pass"])
-            elif bin_center < 80:
-                patch.set_facecolor(grade_colors["good"])
-            elif bin_center < 90:
-                patch.set_facecolor(grade_colors["very_good"])
-            else:
-                patch.set_facecolor(grade_colors["excellent"])
+        # Boje prema ocjenama - raspon svakog stupca po sredini razreda
+        centers = (bins[:-1] + bins[1:]) / 2
+        band_colors = self.style.score_band_colors
+        bands = np.searchsorted(self.SCORE_BAND_LIMITS, centers, side="right")
+        for patch, band in zip(patches, bands.tolist()):
+            patch.set_facecolor(band_colors[band])
 
         # Linije za prolaz i prosjek
         ax.axvline(x=50, color=theme.error, linestyle="--", linewidth=2, label="Prolaz (50)")
-        mean_score = df["bodovi"].mean()
+        mean_score = data.average_score
         ax.axvline(
             x=mean_score,
             color=theme.info,
@@ -239,12 +493,13 @@ class GraphManager:
         fig.tight_layout()
         return fig
 
-    def _fig_avg_score_by_term(self, df: pd.DataFrame) -> Figure:
+    def _fig_avg_score_by_term(self, data: ExamData, fig: Figure | None = None) -> Figure:
         """Linijski graf prosječnih bodova po terminu."""
         theme = self.theme
-        fig, ax = self._create_figure()
+        fig, ax = self._create_figure(fig=fig)
 
-        averages = df.groupby("termin")["bodovi"].mean().sort_index()
+        # Sažetak je sortiran po terminu (kod kategorija redom kategorija)
+        averages = data.get_term_summary()["avg_score"]
 
         ax.plot(
             averages.index,
@@ -291,36 +546,38 @@ class GraphManager:
         fig.tight_layout()
         return fig
 
-    def _fig_pass_rate_by_term(self, df: pd.DataFrame) -> Figure:
+    def _pass_rate_colors(self, heights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Boje ispune i ruba stupaca prema prolaznosti (<50 %, <70 %, ostalo)."""
+        theme = self.theme
+        conditions = [heights < 50, heights < 70]
+        faces = np.select(conditions, [theme.error, theme.warning], default=theme.success)
+        # Slabija prolaznost ima rub u boji stupca, dobra rub u boji pozadine
+        edges = np.select(conditions, [theme.error, theme.warning], default=theme.graph_bg)
+        return faces, edges
+
+    @staticmethod
+    def _label_pass_rate_bar(text: Text, height: float) -> None:
+        """Oznaka vrijednosti iznad stupca prolaznosti."""
+        text.set_y(height + 2)
+        text.set_text(f"{height:.1f}%")
+
+    def _fig_pass_rate_by_term(self, data: ExamData, fig: Figure | None = None) -> Figure:
         """Stupčasti graf prolaznosti po terminu."""
         theme = self.theme
-        fig, ax = self._create_figure()
+        fig, ax = self._create_figure(fig=fig)
 
-        def calc_pass_rate(group: pd.DataFrame) -> float:
-            passed = (group["ocjena"] >= 2).sum()
-            return (passed / len(group)) * 100 if len(group) > 0 else 0.0
-
-        pass_rates = df.groupby("termin", group_keys=False).apply(
-            lambda g: calc_pass_rate(g)
-        ).sort_index()
+        pass_rates = data.get_term_summary()["pass_rate"]
+        faces, edges = self._pass_rate_colors(pass_rates.to_numpy())
 
         bars = ax.bar(
             pass_rates.index,
             pass_rates.values,
-            color=theme.success,
-            edgecolor=theme.graph_bg,
+            color=faces.tolist(),
+            edgecolor=edges.tolist(),
             linewidth=2
         )
 
-        # Boje prema prolaznosti
-        for bar in bars:
-            height = bar.get_height()
-            if height < 50:
-                bar.set_color(theme.error)
-            elif height < 70:
-                bar.set_color(theme.warning)
-
-        ax.axhline(y=50, color=theme.error, linestyle="--", linewidth=2, alpha=0.7)
+        pass_line = ax.axhline(y=50, color=theme.error, linestyle="--", linewidth=2, alpha=0.7)
 
         ax.set_title(
             "Prolaznost po ispitnom terminu",
@@ -333,31 +590,59 @@ class GraphManager:
         ax.set_ylabel("Prolaznost (%)", fontsize=11)
         ax.set_ylim(0, 105)
 
+        texts = []
         for bar in bars:
             height = bar.get_height()
-            ax.text(
+            text = ax.text(
                 bar.get_x() + bar.get_width() / 2,
-                height + 2,
-                f"{height:.1f}%",
+                0,
+                "",
                 ha="center",
                 va="bottom",
                 fontsize=10,
                 fontweight="bold",
                 color=theme.graph_fg
             )
+            self._label_pass_rate_bar(text, height)
+            texts.append(text)
 
         fig.tight_layout()
+        self._set_rendered(fig, (
+            GraphType.PASS_RATE_BY_TERM,
+            (list(pass_rates.index), list(bars), texts, [pass_line, *ax.spines.values()]),
+        ))
         return fig
 
-    def _fig_boxplot_by_term(self, df: pd.DataFrame) -> Figure:
+    def _update_pass_rate_by_term(self, data: ExamData, state) -> list[Artist] | None:
+        """Mijenja visine stupaca prolaznosti; os Y je fiksna (0-105)."""
+        terms, bars, texts, overlays = state
+        pass_rates = data.get_term_summary()["pass_rate"]
+
+        # Drugi termini znače druge stupce i oznake osi
+        if list(pass_rates.index) != terms:
+            return None
+
+        heights = pass_rates.to_numpy()
+        faces, edges = self._pass_rate_colors(heights)
+        for bar, text, height, face, edge in zip(bars, texts, heights.tolist(), faces, edges):
+            bar.set_height(height)
+            bar.set_facecolor(face)
+            bar.set_edgecolor(edge)
+            self._label_pass_rate_bar(text, height)
+
+        # Linija prolaza i osi leže iznad stupaca, pa se crtaju ponovno
+        return sorted([*bars, *overlays, *texts], key=lambda artist: artist.get_zorder())
+
+    def _fig_boxplot_by_term(self, data: ExamData, fig: Figure | None = None) -> Figure:
         """Box plot distribucije bodova po terminu."""
         theme = self.theme
-        fig, ax = self._create_figure()
+        fig, ax = self._create_figure(fig=fig)
 
-        terms = sorted(df["termin"].unique())
-        data = [df[df["termin"] == t]["bodovi"].values for t in terms]
-
-        bp = ax.boxplot(data, labels=terms, patch_artist=True)
+        # Bodovi su podijeljeni po terminu jednim groupby prolazom (memoizirano)
+        scores_by_term = data.get_scores_by_term()
+        bp = ax.boxplot(
+            list(scores_by_term.values()), labels=list(scores_by_term), patch_artist=True
+        )
 
         for i, box in enumerate(bp["boxes"]):
             color_idx = i % len(theme.graph_colors)